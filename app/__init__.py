@@ -18,6 +18,7 @@ import sentry_sdk
 from sentry_sdk.integrations.flask import FlaskIntegration
 
 from app.core.config import get_config, Config
+from app.core.json import init_json
 from app.models import db
 
 # Initialize extensions
@@ -47,6 +48,9 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     config = get_config(config_name)
     app.config.from_object(config)
 
+    # Fast JSON serialization (orjson-backed, when installed)
+    init_json(app)
+
     # Initialize extensions
     init_extensions(app, config)
 
@@ -107,7 +111,7 @@ def init_extensions(app: Flask, config: Config) -> None:
         "CACHE_KEY_PREFIX": config.CACHE_KEY_PREFIX,
     }
 
-    if config.CACHE_TYPE == "redis":
+    if config.CACHE_TYPE == "RedisCache":
         cache_config["CACHE_REDIS_URL"] = config.REDIS_URL
 
     cache.init_app(app, config=cache_config)
@@ -2,8 +2,13 @@
 API package for the student platform application.
 """
 
+from flask import Blueprint, make_response
 from flask_restx import Api
-from flask import Blueprint
+
+try:
+    import orjson
+except ImportError:  # optional, mirrors app/core/json.py
+    orjson = None
 
 # Create API blueprint
 api_bp = Blueprint("api", __name__, url_prefix="/api")
@@ -18,6 +23,16 @@ api = Api(
     prefix="/v1",
 )
 
+if orjson is not None:
+
+    @api.representation("application/json")
+    def _output_json(data, code, headers=None):
+        """Serialize API responses with orjson instead of stdlib json."""
+        resp = make_response(orjson.dumps(data, default=str), code)
+        resp.headers.extend(headers or {})
+        resp.mimetype = "application/json"
+        return resp
+
 # Import and register namespaces
 from app.api.v1.students import students_ns
 from app.api.v1.applications import applications_ns
@@ -2,7 +2,7 @@
 Applications API endpoints using Flask-RESTX.
 """
 
-from flask import request, jsonify
+from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -38,7 +38,6 @@ applications_list_model = applications_ns.model('ApplicationsList', {
 @applications_ns.route('/')
 class ApplicationsList(Resource):
     @applications_ns.doc('list_applications')
-    @applications_ns.marshal_with(applications_list_model)
     @limiter.limit("100 per minute")
     def get(self):
         """
@@ -109,42 +108,37 @@ class ApplicationsList(Resource):
                 )
 
             return (
-                jsonify(
-                    {
-                        "status": "success",
-                        "data": {
-                            "applications": applications_data,
-                            "pagination": {
-                                "page": paginated_applications.page,
-                                "per_page": paginated_applications.per_page,
-                                "total": paginated_applications.total,
-                                "pages": paginated_applications.pages,
-                                "has_next": paginated_applications.has_next,
-                                "has_prev": paginated_applications.has_prev,
-                            },
+                {
+                    "status": "success",
+                    "data": {
+                        "applications": applications_data,
+                        "pagination": {
+                            "page": paginated_applications.page,
+                            "per_page": paginated_applications.per_page,
+                            "total": paginated_applications.total,
+                            "pages": paginated_applications.pages,
+                            "has_next": paginated_applications.has_next,
+                            "has_prev": paginated_applications.has_prev,
                         },
-                    }
-                ),
+                    },
+                },
                 200,
             )
 
         except Exception as e:
             return (
-                jsonify(
-                    {
-                        "status": "error",
-                        "error": {
-                            "code": "INTERNAL_SERVER_ERROR",
-                            "message": "Failed to retrieve applications",
-                        },
-                    }
-                ),
+                {
+                    "status": "error",
+                    "error": {
+                        "code": "INTERNAL_SERVER_ERROR",
+                        "message": "Failed to retrieve applications",
+                    },
+                },
                 500,
             )
 
     @applications_ns.doc('create_application')
     @applications_ns.expect(application_model)
-    @applications_ns.marshal_with(application_model, code=201)
     @limiter.limit("50 per minute")
     def post(self):
         """
@@ -161,15 +155,13 @@ class ApplicationsList(Resource):
 
             if not data:
                 return (
-                    jsonify(
-                        {
-                            "status": "error",
-                            "error": {
-                                "code": "BAD_REQUEST",
-                                "message": "Request body must be JSON",
-                            },
-                        }
-                    ),
+                    {
+                        "status": "error",
+                        "error": {
+                            "code": "BAD_REQUEST",
+                            "message": "Request body must be JSON",
+                        },
+                    },
                     400,
                 )
 
@@ -185,43 +177,37 @@ class ApplicationsList(Resource):
 
             if missing_fields:
                 return (
-                    jsonify(
-                        {
-                            "status": "error",
-                            "error": {
-                                "code": "VALIDATION_ERROR",
-                                "message": f'Missing required fields: {", ".join(missing_fields)}',
-                            },
-                        }
-                    ),
+                    {
+                        "status": "error",
+                        "error": {
+                            "code": "VALIDATION_ERROR",
+                            "message": f'Missing required fields: {", ".join(missing_fields)}',
+                        },
+                    },
                     422,
                 )
 
             # Check if student exists
-            student = Student.query.get(data["student_id"])
+            student = db.session.get(Student, data["student_id"])
             if not student:
                 return (
-                    jsonify(
-                        {
-                            "status": "error",
-                            "error": {"code": "NOT_FOUND", "message": "Student not found"},
-                        }
-                    ),
+                    {
+                        "status": "error",
+                        "error": {"code": "NOT_FOUND", "message": "Student not found"},
+                    },
                     404,
                 )
 
             # Validate status
             if data["status"] not in Application.VALID_STATUSES:
                 return (
-                    jsonify(
-                        {
-                            "status": "error",
-                            "error": {
-                                "code": "VALIDATION_ERROR",
-                                "message": f'Invalid status. Must be one of: {", ".join(Application.VALID_STATUSES)}',
-                            },
-                        }
-                    ),
+                    {
+                        "status": "error",
+                        "error": {
+                            "code": "VALIDATION_ERROR",
+                            "message": f'Invalid status. Must be one of: {Application._VALID_STATUS_MSG}',
+                        },
+                    },
                     422,
                 )
 
@@ -241,46 +227,42 @@ class ApplicationsList(Resource):
             StatusCalculator.update_student_highest_status(data["student_id"])
 
             return (
-                jsonify(
-                    {
-                        "status": "success",
-                        "data": {
-                            "application": {
-                                "id": application.id,
-                                "student_id": application.student_id,
-                                "university_name": application.university_name,
-                                "program_name": application.program_name,
-                                "intake": application.intake,
-                                "status": application.status,
-                                "created_at": (
-                                    application.created_at.isoformat()
-                                    if application.created_at
-                                    else None
-                                ),
-                                "updated_at": (
-                                    application.updated_at.isoformat()
-                                    if application.updated_at
-                                    else None
-                                ),
-                            }
-                        },
-                    }
-                ),
+                {
+                    "status": "success",
+                    "data": {
+                        "application": {
+                            "id": application.id,
+                            "student_id": application.student_id,
+                            "university_name": application.university_name,
+                            "program_name": application.program_name,
+                            "intake": application.intake,
+                            "status": application.status,
+                            "created_at": (
+                                application.created_at.isoformat()
+                                if application.created_at
+                                else None
+                            ),
+                            "updated_at": (
+                                application.updated_at.isoformat()
+                                if application.updated_at
+                                else None
+                            ),
+                        }
+                    },
+                },
                 201,
             )
 
         except Exception as e:
             db.session.rollback()
             return (
-                jsonify(
-                    {
-                        "status": "error",
-                        "error": {
-                            "code": "INTERNAL_SERVER_ERROR",
-                            "message": "Failed to create application",
-                        },
-                    }
-                ),
+                {
+                    "status": "error",
+                    "error": {
+                        "code": "INTERNAL_SERVER_ERROR",
+                        "message": "Failed to create application",
+                    },
+                },
                 500,
             )
 
@@ -288,7 +270,6 @@ class ApplicationsList(Resource):
 @applications_ns.route('/<int:application_id>')
 class ApplicationDetail(Resource):
     @applications_ns.doc('get_application')
-    @applications_ns.marshal_with(application_model)
     @limiter.limit("200 per minute")
     def get(self, application_id):
         """
@@ -301,51 +282,46 @@ class ApplicationDetail(Resource):
             JSON response with application data
         """
         try:
-            application = Application.query.get_or_404(application_id)
+            application = db.get_or_404(Application, application_id)
 
             return (
-                jsonify(
-                    {
-                        "status": "success",
-                        "data": {
-                            "application": {
-                                "id": application.id,
-                                "student_id": application.student_id,
-                                "university_name": application.university_name,
-                                "program_name": application.program_name,
-                                "intake": application.intake,
-                                "status": application.status,
-                                "created_at": (
-                                    application.created_at.isoformat()
-                                    if application.created_at
-                                    else None
-                                ),
-                                "updated_at": (
-                                    application.updated_at.isoformat()
-                                    if application.updated_at
-                                    else None
-                                ),
-                            }
-                        },
-                    }
-                ),
+                {
+                    "status": "success",
+                    "data": {
+                        "application": {
+                            "id": application.id,
+                            "student_id": application.student_id,
+                            "university_name": application.university_name,
+                            "program_name": application.program_name,
+                            "intake": application.intake,
+                            "status": application.status,
+                            "created_at": (
+                                application.created_at.isoformat()
+                                if application.created_at
+                                else None
+                            ),
+                            "updated_at": (
+                                application.updated_at.isoformat()
+                                if application.updated_at
+                                else None
+                            ),
+                        }
+                    },
+                },
                 200,
             )
 
         except Exception as e:
             return (
-                jsonify(
-                    {
-                        "status": "error",
-                        "error": {"code": "NOT_FOUND", "message": "Application not found"},
-                    }
-                ),
+                {
+                    "status": "error",
+                    "error": {"code": "NOT_FOUND", "message": "Application not found"},
+                },
                 404,
             )
 
     @applications_ns.doc('update_application')
     @applications_ns.expect(application_model)
-    @applications_ns.marshal_with(application_model)
     @limiter.limit("100 per minute")
     def put(self, application_id):
         """
@@ -361,20 +337,18 @@ class ApplicationDetail(Resource):
             JSON response with updated application data
         """
         try:
-            application = Application.query.get_or_404(application_id)
+            application = db.get_or_404(Application, application_id)
             data = request.get_json()
 
             if not data:
                 return (
-                    jsonify(
-                        {
-                            "status": "error",
-                            "error": {
-                                "code": "BAD_REQUEST",
-                                "message": "Request body must be JSON",
-                            },
-                        }
-                    ),
+                    {
+                        "status": "error",
+                        "error": {
+                            "code": "BAD_REQUEST",
+                            "message": "Request body must be JSON",
+                        },
+                    },
                     400,
                 )
 
@@ -389,18 +363,16 @@ class ApplicationDetail(Resource):
                 # Validate status
                 if data["status"] not in Application.VALID_STATUSES:
                     return (
-                        jsonify(
-                            {
-                                "status": "error",
-                                "error": {
-                                    "code": "VALIDATION_ERROR",
-                                    "message": f'Invalid status. Must be one of: {", ".join(Application.VALID_STATUSES)}',
-                                },
-                            }
-                        ),
+                        {
+                            "status": "error",
+                            "error": {
+                                "code": "VALIDATION_ERROR",
+                                "message": f'Invalid status. Must be one of: {Application._VALID_STATUS_MSG}',
+                            },
+                        },
                         422,
                     )
-                application.status = data["status"]
+                application.update_status(data["status"])
 
             db.session.commit()
 
@@ -408,46 +380,42 @@ class ApplicationDetail(Resource):
             StatusCalculator.update_student_highest_status(application.student_id)
 
             return (
-                jsonify(
-                    {
-                        "status": "success",
-                        "data": {
-                            "application": {
-                                "id": application.id,
-                                "student_id": application.student_id,
-                                "university_name": application.university_name,
-                                "program_name": application.program_name,
-                                "intake": application.intake,
-                                "status": application.status,
-                                "created_at": (
-                                    application.created_at.isoformat()
-                                    if application.created_at
-                                    else None
-                                ),
-                                "updated_at": (
-                                    application.updated_at.isoformat()
-                                    if application.updated_at
-                                    else None
-                                ),
-                            }
-                        },
-                    }
-                ),
+                {
+                    "status": "success",
+                    "data": {
+                        "application": {
+                            "id": application.id,
+                            "student_id": application.student_id,
+                            "university_name": application.university_name,
+                            "program_name": application.program_name,
+                            "intake": application.intake,
+                            "status": application.status,
+                            "created_at": (
+                                application.created_at.isoformat()
+                                if application.created_at
+                                else None
+                            ),
+                            "updated_at": (
+                                application.updated_at.isoformat()
+                                if application.updated_at
+                                else None
+                            ),
+                        }
+                    },
+                },
                 200,
             )
 
         except Exception as e:
             db.session.rollback()
             return (
-                jsonify(
-                    {
-                        "status": "error",
-                        "error": {
-                            "code": "INTERNAL_SERVER_ERROR",
-                            "message": "Failed to update application",
-                        },
-                    }
-                ),
+                {
+                    "status": "error",
+                    "error": {
+                        "code": "INTERNAL_SERVER_ERROR",
+                        "message": "Failed to update application",
+                    },
+                },
                 500,
             )
 
@@ -464,7 +432,7 @@ class ApplicationDetail(Resource):
             JSON response confirming deletion
         """
         try:
-            application = Application.query.get_or_404(application_id)
+            application = db.get_or_404(Application, application_id)
             student_id = application.student_id
 
             db.session.delete(application)
@@ -474,24 +442,20 @@ class ApplicationDetail(Resource):
             StatusCalculator.update_student_highest_status(student_id)
 
             return (
-                jsonify(
-                    {"status": "success", "message": "Application deleted successfully"}
-                ),
+                {"status": "success", "message": "Application deleted successfully"},
                 200,
             )
 
         except Exception as e:
             db.session.rollback()
             return (
-                jsonify(
-                    {
-                        "status": "error",
-                        "error": {
-                            "code": "INTERNAL_SERVER_ERROR",
-                            "message": "Failed to delete application",
-                        },
-                    }
-                ),
+                {
+                    "status": "error",
+                    "error": {
+                        "code": "INTERNAL_SERVER_ERROR",
+                        "message": "Failed to delete application",
+                    },
+                },
                 500,
             )
 
@@ -499,7 +463,6 @@ class ApplicationDetail(Resource):
 @applications_ns.route('/students/<int:student_id>')
 class StudentApplications(Resource):
     @applications_ns.doc('get_student_applications')
-    @applications_ns.marshal_with(applications_list_model)
     @limiter.limit("200 per minute")
     def get(self, student_id):
         """
@@ -518,7 +481,7 @@ class StudentApplications(Resource):
         """
         try:
             # Check if student exists
-            student = Student.query.get_or_404(student_id)
+            student = db.get_or_404(Student, student_id)
 
             # Get query parameters
             page = request.args.get("page", 1, type=int)
@@ -562,36 +525,32 @@ class StudentApplications(Resource):
                 )
 
             return (
-                jsonify(
-                    {
-                        "status": "success",
-                        "data": {
-                            "student_id": student_id,
-                            "applications": applications_data,
-                            "pagination": {
-                                "page": paginated_applications.page,
-                                "per_page": paginated_applications.per_page,
-                                "total": paginated_applications.total,
-                                "pages": paginated_applications.pages,
-                                "has_next": paginated_applications.has_next,
-                                "has_prev": paginated_applications.has_prev,
-                            },
+                {
+                    "status": "success",
+                    "data": {
+                        "student_id": student_id,
+                        "applications": applications_data,
+                        "pagination": {
+                            "page": paginated_applications.page,
+                            "per_page": paginated_applications.per_page,
+                            "total": paginated_applications.total,
+                            "pages": paginated_applications.pages,
+                            "has_next": paginated_applications.has_next,
+                            "has_prev": paginated_applications.has_prev,
                         },
-                    }
-                ),
+                    },
+                },
                 200,
             )
 
         except Exception as e:
             return (
-                jsonify(
-                    {
-                        "status": "error",
-                        "error": {
-                            "code": "INTERNAL_SERVER_ERROR",
-                            "message": "Failed to retrieve student applications",
-                        },
-                    }
-                ),
+                {
+                    "status": "error",
+                    "error": {
+                        "code": "INTERNAL_SERVER_ERROR",
+                        "message": "Failed to retrieve student applications",
+                    },
+                },
                 500,
             )
@@ -2,8 +2,9 @@
 Students API endpoints using Flask-RESTX.
 """
 
-from flask import request, jsonify
+from flask import request
 from flask_restx import Namespace, Resource, fields
+from sqlalchemy.exc import IntegrityError
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from app.models.student import Student
@@ -55,33 +56,72 @@ students_list_model = students_ns.model('StudentsList', {
 })
 
 
+def _student_summary(student):
+    """Serialize one student row for list responses."""
+    return {
+        'id': student.id,
+        'name': student.name,
+        'email': student.email,
+        'phone': student.phone,
+        'highest_status': student.highest_status,
+        'highest_intake': student.highest_intake,
+        'created_at': student.created_at.isoformat() if student.created_at else None,
+        'updated_at': student.updated_at.isoformat() if student.updated_at else None
+    }
+
+
 @students_ns.route('/')
 class StudentsResource(Resource):
     @students_ns.doc('list_students')
-    @students_ns.marshal_with(students_list_model)
     def get(self):
         """Get all students with optional filtering and pagination."""
         try:
             # Get query parameters
             page = request.args.get('page', 1, type=int)
             per_page = min(request.args.get('per_page', 10, type=int), 100)
+            after = request.args.get('after', type=int)
             status = request.args.get('status')
             search = request.args.get('search')
-            
+
             # Build query
             query = Student.query
-            
+
             # Apply filters
             if status:
                 query = query.filter(Student.highest_status == status)
-            
+
             if search:
                 search_term = f"%{search}%"
                 query = query.filter(
                     (Student.name.ilike(search_term)) |
                     (Student.email.ilike(search_term))
                 )
-            
+
+            # Keyset pagination: ?after=<id> walks the primary key
+            # directly, so deep pages cost O(log N) instead of the
+            # O(offset) row skipping done by LIMIT/OFFSET
+            if after is not None:
+                students = (
+                    query.filter(Student.id > after)
+                    .order_by(Student.id)
+                    .limit(per_page)
+                    .all()
+                )
+                return {
+                    'status': 'success',
+                    'data': {
+                        'students': [_student_summary(s) for s in students],
+                        'pagination': {
+                            'per_page': per_page,
+                            'next_cursor': (
+                                students[-1].id
+                                if len(students) == per_page
+                                else None
+                            )
+                        }
+                    }
+                }, 200
+
             # Execute query with pagination
             paginated_students = query.paginate(
                 page=page,
@@ -90,20 +130,11 @@ class StudentsResource(Resource):
             )
             
             # Format response
-            students_data = []
-            for student in paginated_students.items:
-                students_data.append({
-                    'id': student.id,
-                    'name': student.name,
-                    'email': student.email,
-                    'phone': student.phone,
-                    'highest_status': student.highest_status,
-                    'highest_intake': student.highest_intake,
-                    'created_at': student.created_at.isoformat() if student.created_at else None,
-                    'updated_at': student.updated_at.isoformat() if student.updated_at else None
-                })
-            
-            return jsonify({
+            students_data = [
+                _student_summary(student) for student in paginated_students.items
+            ]
+
+            return {
                 'status': 'success',
                 'data': {
                     'students': students_data,
@@ -116,69 +147,68 @@ class StudentsResource(Resource):
                         'has_prev': paginated_students.has_prev
                     }
                 }
-            }), 200
+            }, 200
             
         except Exception as e:
-            return jsonify({
+            return {
                 'status': 'error',
                 'error': {
                     'code': 'INTERNAL_SERVER_ERROR',
                     'message': 'Failed to retrieve students'
                 }
-            }), 500
+            }, 500
 
     @students_ns.doc('create_student')
     @students_ns.expect(student_create_model)
-    @students_ns.marshal_with(student_model, code=201)
     def post(self):
         """Create a new student."""
         try:
             data = request.get_json()
             
             if not data:
-                return jsonify({
+                return {
                     'status': 'error',
                     'error': {
                         'code': 'BAD_REQUEST',
                         'message': 'Request body must be JSON'
                     }
-                }), 400
+                }, 400
             
             # Validate required fields
             required_fields = ['name', 'email', 'phone']
             missing_fields = [field for field in required_fields if not data.get(field)]
             
             if missing_fields:
-                return jsonify({
+                return {
                     'status': 'error',
                     'error': {
                         'code': 'VALIDATION_ERROR',
                         'message': f'Missing required fields: {", ".join(missing_fields)}'
                     }
-                }), 422
-            
-            # Check if email already exists
-            existing_student = Student.query.filter_by(email=data['email']).first()
-            if existing_student:
-                return jsonify({
-                    'status': 'error',
-                    'error': {
-                        'code': 'CONFLICT',
-                        'message': 'Student with this email already exists'
-                    }
-                }), 409
+                }, 422
             
-            # Create new student
+            # Create new student - rely on the unique constraint instead of
+            # probing for duplicates first, so the happy path is one roundtrip
             student = Student(
                 name=data['name'],
                 email=data['email'],
                 phone=data['phone']
             )
-            
+
             db.session.add(student)
-            db.session.commit()
+            try:
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                return {
+                    'status': 'error',
+                    'error': {
+                        'code': 'CONFLICT',
+                        'message': 'Student with this email already exists'
+                    }
+                }, 409
             
-            return jsonify({
+            return {
                 'status': 'success',
                 'data': {
                     'student': {
@@ -192,29 +222,30 @@ class StudentsResource(Resource):
                         'updated_at': student.updated_at.isoformat() if student.updated_at else None
                     }
                 }
-            }), 201
+            }, 201
             
         except Exception as e:
             db.session.rollback()
-            return jsonify({
+            return {
                 'status': 'error',
                 'error': {
                     'code': 'INTERNAL_SERVER_ERROR',
                     'message': 'Failed to create student'
                 }
-            }), 500
+            }, 500
 
 
 @students_ns.route('/<int:student_id>')
 class StudentResource(Resource):
     @students_ns.doc('get_student')
-    @students_ns.marshal_with(student_model)
     def get(self, student_id):
         """Get a specific student by ID."""
         try:
-            student = Student.query.get_or_404(student_id)
+            # session.get (unlike legacy Query.get) checks the identity
+            # map first, so repeat lookups in one session skip the SELECT
+            student = db.get_or_404(Student, student_id)
             
-            return jsonify({
+            return {
                 'status': 'success',
                 'data': {
                     'student': {
@@ -228,34 +259,33 @@ class StudentResource(Resource):
                         'updated_at': student.updated_at.isoformat() if student.updated_at else None
                     }
                 }
-            }), 200
+            }, 200
             
         except Exception as e:
-            return jsonify({
+            return {
                 'status': 'error',
                 'error': {
                     'code': 'NOT_FOUND',
                     'message': 'Student not found'
                 }
-            }), 404
+            }, 404
 
     @students_ns.doc('update_student')
     @students_ns.expect(student_create_model)
-    @students_ns.marshal_with(student_model)
     def put(self, student_id):
         """Update a student."""
         try:
-            student = Student.query.get_or_404(student_id)
+            student = db.get_or_404(Student, student_id)
             data = request.get_json()
             
             if not data:
-                return jsonify({
+                return {
                     'status': 'error',
                     'error': {
                         'code': 'BAD_REQUEST',
                         'message': 'Request body must be JSON'
                     }
-                }), 400
+                }, 400
             
             # Update fields if provided
             if 'name' in data:
@@ -267,20 +297,20 @@ class StudentResource(Resource):
                     Student.id != student_id
                 ).first()
                 if existing_student:
-                    return jsonify({
+                    return {
                         'status': 'error',
                         'error': {
                             'code': 'CONFLICT',
                             'message': 'Student with this email already exists'
                         }
-                    }), 409
+                    }, 409
                 student.email = data['email']
             if 'phone' in data:
                 student.phone = data['phone']
             
             db.session.commit()
             
-            return jsonify({
+            return {
                 'status': 'success',
                 'data': {
                     'student': {
@@ -294,51 +324,50 @@ class StudentResource(Resource):
                         'updated_at': student.updated_at.isoformat() if student.updated_at else None
                     }
                 }
-            }), 200
+            }, 200
             
         except Exception as e:
             db.session.rollback()
-            return jsonify({
+            return {
                 'status': 'error',
                 'error': {
                     'code': 'INTERNAL_SERVER_ERROR',
                     'message': 'Failed to update student'
                 }
-            }), 500
+            }, 500
 
     @students_ns.doc('delete_student')
     def delete(self, student_id):
         """Delete a student."""
         try:
-            student = Student.query.get_or_404(student_id)
+            student = db.get_or_404(Student, student_id)
             
             db.session.delete(student)
             db.session.commit()
             
-            return jsonify({
+            return {
                 'status': 'success',
                 'message': 'Student deleted successfully'
-            }), 200
+            }, 200
             
         except Exception as e:
             db.session.rollback()
-            return jsonify({
+            return {
                 'status': 'error',
                 'error': {
                     'code': 'INTERNAL_SERVER_ERROR',
                     'message': 'Failed to delete student'
                 }
-            }), 500
+            }, 500
 
 
 @students_ns.route('/<int:student_id>/status')
 class StudentStatusResource(Resource):
     @students_ns.doc('get_student_status')
-    @students_ns.marshal_with(student_status_model)
     def get(self, student_id):
         """Get the highest status and highest intake for a student."""
         try:
-            student = Student.query.get_or_404(student_id)
+            student = db.get_or_404(Student, student_id)
             
             # Get applications for the student
             from app.models.application import Application
@@ -348,20 +377,20 @@ class StudentStatusResource(Resource):
             status_calculator = StatusCalculator()
             result = status_calculator.calculate_highest_status(applications)
             
-            return jsonify({
+            return {
                 'status': 'success',
                 'data': {
                     'student_id': student.id,
                     'highest_status': result['highest_status'],
                     'highest_intake': result['highest_intake']
                 }
-            }), 200
+            }, 200
             
         except Exception as e:
-            return jsonify({
+            return {
                 'status': 'error',
                 'error': {
                     'code': 'INTERNAL_SERVER_ERROR',
                     'message': 'Failed to calculate student status'
                 }
-            }), 500
+            }, 500
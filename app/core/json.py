@@ -0,0 +1,49 @@
+"""
+JSON Provider
+orjson-backed JSON provider for faster response serialization.
+"""
+
+import logging
+from typing import Any, Union
+
+from flask import Flask
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    orjson encodes/decodes in native code, several times faster than
+    the stdlib json module. datetime/date/UUID values serialize to
+    ISO 8601 natively; anything else unknown falls back to str().
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+def init_json(app: Flask) -> None:
+    """
+    Install the orjson provider on the app when orjson is available.
+
+    Falls back silently to Flask's default provider otherwise, so the
+    dependency stays optional.
+
+    Args:
+        app: Flask application instance
+    """
+    if orjson is None:
+        logger.debug("orjson not installed - using Flask's default JSON provider")
+        return
+    app.json = OrjsonProvider(app)
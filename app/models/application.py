@@ -4,9 +4,10 @@ Represents a university application for a student.
 """
 
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional, Dict, Any, TYPE_CHECKING
 from sqlalchemy import String, Integer, ForeignKey, Text, Index, CheckConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, reconstructor, relationship, validates
 from sqlalchemy.ext.hybrid import hybrid_property
 from app.models.base import BaseModel, db
 
@@ -51,15 +52,27 @@ class Application(BaseModel):
         STATUS_DROPPED,
     ]
 
-    # Status weights for comparison (higher = more advanced)
-    STATUS_WEIGHTS = {
+    # Status weights for comparison (higher = more advanced). Read-only
+    # proxy: shared across services, so accidental mutation would
+    # silently change ranking everywhere.
+    STATUS_WEIGHTS = MappingProxyType({
         STATUS_BUILDING: 1,
         STATUS_SUBMITTED: 2,
         STATUS_OFFER_RECEIVED: 3,
         STATUS_OFFER_ACCEPTED: 4,
         STATUS_VISA_APPROVED: 5,
         STATUS_DROPPED: 0,  # Special case - excluded from calculations
-    }
+    })
+
+    # Statuses considered successful (precomputed for O(1) membership checks)
+    _SUCCESS_SET = frozenset(
+        {STATUS_OFFER_RECEIVED, STATUS_OFFER_ACCEPTED, STATUS_VISA_APPROVED}
+    )
+
+    # Precomputed strings so error paths and the check constraint don't
+    # rebuild them on every use
+    _VALID_STATUS_MSG = ", ".join(VALID_STATUSES)
+    _VALID_STATUS_SQL_IN = "(" + ", ".join(repr(s) for s in VALID_STATUSES) + ")"
 
     # =====================================================
     # Column Definitions
@@ -90,6 +103,13 @@ class Application(BaseModel):
         comment="Intake period (e.g., 'Jan 2026', 'Sep 2026')",
     )
 
+    intake_sortkey: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        index=True,
+        comment="Parsed intake as year*12+month for integer comparisons",
+    )
+
     status: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
@@ -128,8 +148,17 @@ class Application(BaseModel):
         Index("idx_application_status", "status"),
         Index("idx_application_intake", "intake"),
         Index("idx_application_student_status", "student_id", "status"),
+        # Covers the hot (student_id, is_deleted) filters from the status
+        # calculator; trailing columns enable index-only scans on Postgres
+        Index(
+            "ix_app_student_active",
+            "student_id",
+            "is_deleted",
+            "status",
+            "intake_sortkey",
+        ),
         CheckConstraint(
-            f"status IN {tuple(VALID_STATUSES)}", name="check_valid_status"
+            f"status IN {_VALID_STATUS_SQL_IN}", name="check_valid_status"
         ),
         {"comment": "Applications table storing university applications for students"},
     )
@@ -138,9 +167,17 @@ class Application(BaseModel):
     # Properties and Hybrid Attributes
     # =====================================================
 
+    @reconstructor
+    def _init_on_load(self) -> None:
+        """Precompute hot serialization values once per load, not per access."""
+        self._status_weight = self.STATUS_WEIGHTS.get(self.status, 0)
+
     @hybrid_property
     def status_weight(self) -> int:
-        """Get the weight of the current status."""
+        """Get the weight of the current status (cached per instance)."""
+        cached = self.__dict__.get("_status_weight")
+        if cached is not None:
+            return cached
         return self.STATUS_WEIGHTS.get(self.status, 0)
 
     @hybrid_property
@@ -180,16 +217,24 @@ class Application(BaseModel):
     @property
     def is_successful(self) -> bool:
         """Check if application has reached a successful state."""
-        return self.status in [
-            self.STATUS_OFFER_RECEIVED,
-            self.STATUS_OFFER_ACCEPTED,
-            self.STATUS_VISA_APPROVED,
-        ]
+        return self.status in self._SUCCESS_SET
 
     # =====================================================
     # Instance Methods
     # =====================================================
 
+    @validates("intake")
+    def _set_intake_sortkey(self, key: str, value: Optional[str]) -> Optional[str]:
+        """Keep intake_sortkey in sync whenever intake is set."""
+        from app.services.status_calculator import StatusCalculator
+
+        if value:
+            year, month = StatusCalculator.parse_intake_date(value)
+            self.intake_sortkey = year * 12 + month
+        else:
+            self.intake_sortkey = None
+        return value
+
     def update_status(self, new_status: str) -> bool:
         """
         Update the application status.
@@ -204,6 +249,7 @@ class Application(BaseModel):
             return False
 
         self.status = new_status
+        self._status_weight = self.STATUS_WEIGHTS.get(new_status, 0)
         self.updated_at = datetime.utcnow()
         return True
 
@@ -244,20 +290,30 @@ class Application(BaseModel):
         Returns:
             Dictionary representation of the application
         """
+        # Touch one column so an expired instance refreshes, then read the
+        # remaining columns straight from __dict__ to skip the instrumented
+        # descriptor protocol — this is the hot path for list endpoints.
+        _ = self.id
+        d = self.__dict__
+
+        status = d.get("status")
+        created_at = d.get("created_at")
+        updated_at = d.get("updated_at")
+
         data = {
-            "id": self.id,
-            "student_id": self.student_id,
-            "university_name": self.university_name,
-            "program_name": self.program_name,
-            "intake": self.intake,
-            "status": self.status,
-            "status_weight": self.status_weight,
-            "is_active": self.is_active,
-            "is_successful": self.is_successful,
-            "application_id": self.application_id,
-            "notes": self.notes,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "id": d.get("id"),
+            "student_id": d.get("student_id"),
+            "university_name": d.get("university_name"),
+            "program_name": d.get("program_name"),
+            "intake": d.get("intake"),
+            "status": status,
+            "status_weight": self.STATUS_WEIGHTS.get(status, 0),
+            "is_active": status != self.STATUS_DROPPED,
+            "is_successful": status in self._SUCCESS_SET,
+            "application_id": d.get("application_id"),
+            "notes": d.get("notes"),
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None,
         }
 
         if include_student and self.student:
@@ -363,11 +419,8 @@ class Application(BaseModel):
     # =====================================================
 
     def __repr__(self) -> str:
-        """String representation of the Application."""
-        return (
-            f"<Application(id={self.id}, student_id={self.student_id}, "
-            f"university='{self.university_name}', status='{self.status}')>"
-        )
+        """String representation of the Application (kept short for log paths)."""
+        return f"<Application {self.id} s={self.student_id} st={self.status!r}>"
 
     def __str__(self) -> str:
         """Human-readable string representation."""
@@ -415,9 +468,7 @@ class Application(BaseModel):
         if not self.status:
             errors.append("Status is required")
         elif self.status not in self.VALID_STATUSES:
-            errors.append(
-                f"Invalid status. Must be one of: {', '.join(self.VALID_STATUSES)}"
-            )
+            errors.append(f"Invalid status. Must be one of: {self._VALID_STATUS_MSG}")
 
         if not self.student_id:
             errors.append("Student ID is required")
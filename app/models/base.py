@@ -106,13 +106,19 @@ class BaseModel(db.Model):
         else:
             self.hard_delete()
 
-    def soft_delete(self) -> None:
+    def soft_delete(self, commit: bool = True) -> None:
         """
         Soft delete the instance (mark as deleted but keep in database).
+
+        Args:
+            commit: If True, commit immediately; if False, leave the commit
+                to the caller so multiple deletes share one transaction
         """
         self.is_deleted = True
         self.deleted_at = datetime.utcnow()
-        self.save()
+        db.session.add(self)
+        if commit:
+            db.session.commit()
 
     def hard_delete(self) -> None:
         """
@@ -5,8 +5,8 @@ Represents a student in the platform with their applications.
 
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, DateTime, Integer, Text, Index
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, DateTime, Integer, Text, Index, text
+from sqlalchemy.orm import Mapped, mapped_column, raiseload, relationship, selectinload
 from sqlalchemy.ext.hybrid import hybrid_property
 from app.models.base import BaseModel, db
 
@@ -41,9 +41,8 @@ class Student(BaseModel):
     email: Mapped[str] = mapped_column(
         String(100),
         nullable=False,
-        unique=True,
         index=True,
-        comment="Student's email address (unique)",
+        comment="Student's email address (unique among active students)",
     )
 
     phone: Mapped[str] = mapped_column(
@@ -81,7 +80,7 @@ class Student(BaseModel):
         "Application",
         back_populates="student",
         cascade="all, delete-orphan",
-        lazy="dynamic",
+        lazy="select",
         order_by="Application.created_at.desc()",
     )
 
@@ -91,6 +90,18 @@ class Student(BaseModel):
 
     __table_args__ = (
         Index("idx_student_email", "email"),
+        # Partial unique index: uniqueness only among non-deleted rows, so a
+        # soft-deleted student's email can be registered again
+        Index(
+            "uq_student_email_active",
+            "email",
+            unique=True,
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # Supports exact/prefix name lookups and keeps name sorts off a
+        # full scan; contains-style ILIKE search still scans
+        Index("idx_student_name", "name"),
         Index("idx_student_highest_status", "highest_status"),
         Index("idx_student_created_at", "created_at"),
         {"comment": "Students table storing student information and calculated status"},
@@ -103,18 +114,16 @@ class Student(BaseModel):
     @hybrid_property
     def active_applications_count(self) -> int:
         """Count of non-dropped applications."""
-        if self.applications:
-            total = self.applications.filter_by(is_deleted=False).count()
-            dropped = self.applications.filter_by(is_deleted=False, status="Dropped").count()
-            return total - dropped
-        return 0
+        return sum(
+            1
+            for app in self.applications
+            if not app.is_deleted and app.status != "Dropped"
+        )
 
     @hybrid_property
     def total_applications_count(self) -> int:
         """Total count of all applications."""
-        if self.applications:
-            return self.applications.filter_by(is_deleted=False).count()
-        return 0
+        return sum(1 for app in self.applications if not app.is_deleted)
 
     @property
     def has_active_applications(self) -> bool:
@@ -154,7 +163,11 @@ class Student(BaseModel):
         Returns:
             List of applications with the specified status
         """
-        return self.applications.filter_by(status=status, is_deleted=False).all()
+        return [
+            app
+            for app in self.applications
+            if app.status == status and not app.is_deleted
+        ]
 
     def get_latest_application(self) -> Optional["Application"]:
         """
@@ -163,11 +176,12 @@ class Student(BaseModel):
         Returns:
             The latest application or None if no applications exist
         """
-        return (
-            self.applications.filter_by(is_deleted=False)
-            .order_by(Application.created_at.desc())
-            .first()
-        )
+        # The relationship is ordered by created_at desc, so the first
+        # non-deleted entry is the latest application.
+        for app in self.applications:
+            if not app.is_deleted:
+                return app
+        return None
 
     def to_dict(self, include_applications: bool = False) -> dict:
         """
@@ -179,34 +193,65 @@ class Student(BaseModel):
         Returns:
             Dictionary representation of the student
         """
+        # Touch one column so an expired instance refreshes, then read the
+        # remaining columns straight from __dict__ to skip the instrumented
+        # descriptor protocol — this is the hot path for list endpoints.
+        _ = self.id
+        d = self.__dict__
+
+        created_at = d.get("created_at")
+        updated_at = d.get("updated_at")
+
         data = {
-            "id": self.id,
-            "name": self.name,
-            "email": self.email,
-            "phone": self.phone,
-            "highest_status": self.highest_status,
-            "highest_intake": self.highest_intake,
+            "id": d.get("id"),
+            "name": d.get("name"),
+            "email": d.get("email"),
+            "phone": d.get("phone"),
+            "highest_status": d.get("highest_status"),
+            "highest_intake": d.get("highest_intake"),
             "active_applications_count": self.active_applications_count,
             "total_applications_count": self.total_applications_count,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None,
         }
 
         if include_applications:
-            data["applications"] = [
-                app.to_dict()
-                for app in self.applications.filter_by(is_deleted=False).all()
-            ]
+            from app.models.application import Application
+
+            data["applications"] = list(
+                map(
+                    Application.to_dict,
+                    (app for app in self.applications if not app.is_deleted),
+                )
+            )
 
         return data
 
-    def soft_delete(self) -> None:
+    def soft_delete(self, commit: bool = True) -> None:
         """
         Soft delete the student and all associated applications.
+
+        The cascade is a single bulk UPDATE on the applications table so the
+        student and all applications land in one transaction instead of one
+        commit per application.
+
+        Args:
+            commit: If True, commit immediately; if False, leave the commit
+                to the caller
         """
-        super().soft_delete()
-        for application in self.applications:
-            application.soft_delete()
+        from app.models.application import Application
+
+        super().soft_delete(commit=False)
+        db.session.execute(
+            db.update(Application)
+            .where(
+                Application.student_id == self.id,
+                Application.is_deleted == False,
+            )
+            .values(is_deleted=True, deleted_at=datetime.utcnow())
+        )
+        if commit:
+            db.session.commit()
 
     # =====================================================
     # Class Methods
@@ -225,6 +270,27 @@ class Student(BaseModel):
         """
         return cls.query.filter_by(email=email, is_deleted=False).first()
 
+    @classmethod
+    def query_with_apps(cls, strict: bool = False):
+        """
+        Query students with applications eagerly loaded.
+
+        This is the sanctioned path for code that serializes students
+        together with their applications: a single extra SELECT via
+        selectinload instead of one lazy load per student.
+
+        Args:
+            strict: If True, any other relationship access raises instead
+                of silently emitting a query, so N+1 regressions fail fast
+
+        Returns:
+            Query with eager-loading options applied
+        """
+        query = cls.query.options(selectinload(cls.applications))
+        if strict:
+            query = query.options(raiseload("*"))
+        return query
+
     @classmethod
     def search(cls, query: str) -> List["Student"]:
         """
@@ -244,13 +310,95 @@ class Student(BaseModel):
             )
         ).all()
 
+    @classmethod
+    def to_dict_bulk(cls, student_ids: List[int]) -> List[dict]:
+        """
+        Serialize many students (with their applications) without ORM
+        hydration.
+
+        Read-only list endpoints don't need full model instances; this
+        runs two Core SELECTs (students + applications) and assembles
+        plain dicts, skipping object construction per row.
+
+        Args:
+            student_ids: IDs of the students to serialize
+
+        Returns:
+            List of student dicts, each with a nested "applications" list
+        """
+        from app.models.application import Application
+
+        if not student_ids:
+            return []
+
+        student_rows = db.session.execute(
+            db.select(
+                cls.id,
+                cls.name,
+                cls.email,
+                cls.phone,
+                cls.highest_status,
+                cls.highest_intake,
+                cls.created_at,
+                cls.updated_at,
+            ).where(cls.id.in_(student_ids), cls.is_deleted == False)
+        ).mappings()
+
+        app_rows = db.session.execute(
+            db.select(
+                Application.id,
+                Application.student_id,
+                Application.university_name,
+                Application.program_name,
+                Application.intake,
+                Application.status,
+                Application.created_at,
+            )
+            .where(
+                Application.student_id.in_(student_ids),
+                Application.is_deleted == False,
+            )
+            .order_by(Application.created_at.desc())
+        ).mappings()
+
+        apps_by_student: dict[int, list[dict]] = {}
+        for row in app_rows:
+            apps_by_student.setdefault(row["student_id"], []).append(
+                {
+                    "id": row["id"],
+                    "university_name": row["university_name"],
+                    "program_name": row["program_name"],
+                    "intake": row["intake"],
+                    "status": row["status"],
+                }
+            )
+
+        return [
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "email": row["email"],
+                "phone": row["phone"],
+                "highest_status": row["highest_status"],
+                "highest_intake": row["highest_intake"],
+                "created_at": (
+                    row["created_at"].isoformat() if row["created_at"] else None
+                ),
+                "updated_at": (
+                    row["updated_at"].isoformat() if row["updated_at"] else None
+                ),
+                "applications": apps_by_student.get(row["id"], []),
+            }
+            for row in student_rows
+        ]
+
     # =====================================================
     # Magic Methods
     # =====================================================
 
     def __repr__(self) -> str:
-        """String representation of the Student."""
-        return f"<Student(id={self.id}, name='{self.name}', email='{self.email}', highest_status='{self.highest_status}')>"
+        """String representation of the Student (kept short for log paths)."""
+        return f"<Student {self.id} {self.email!r} st={self.highest_status!r}>"
 
     def __str__(self) -> str:
         """Human-readable string representation."""
@@ -264,6 +412,11 @@ class Student(BaseModel):
         """
         Validate student data before saving.
 
+        Uniqueness of email is not probed here; the database unique
+        constraint enforces it and save paths catch IntegrityError, so the
+        happy path costs a single roundtrip. Bulk imports can pre-screen a
+        whole batch with find_existing_emails.
+
         Returns:
             List of validation errors (empty if valid)
         """
@@ -278,14 +431,27 @@ class Student(BaseModel):
         if not self.phone or len(self.phone) < 10:
             errors.append("Phone number must be at least 10 digits")
 
-        # Check for duplicate email (excluding soft-deleted records)
-        if self.email:
-            existing = Student.query.filter(
-                Student.email == self.email,
-                Student.id != self.id,
-                Student.is_deleted == False,
-            ).first()
-            if existing:
-                errors.append(f"Email '{self.email}' is already registered")
-
         return errors
+
+    @classmethod
+    def find_existing_emails(cls, emails: List[str]) -> set[str]:
+        """
+        Find which of the given emails are already registered.
+
+        Designed for bulk imports: one IN query covers the whole batch
+        instead of one duplicate-check SELECT per student.
+
+        Args:
+            emails: Email addresses to check
+
+        Returns:
+            Set of emails that already belong to active students
+        """
+        if not emails:
+            return set()
+        rows = (
+            db.session.query(cls.email)
+            .filter(cls.email.in_(emails), cls.is_deleted == False)
+            .all()
+        )
+        return {row[0] for row in rows}
@@ -4,7 +4,10 @@ Core business logic for calculating student's highest application status.
 This is the HEART of the application - handles all status calculation logic.
 """
 
+import functools
 import logging
+import re
+from collections import Counter
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
 from app.models import db, Student, Application
@@ -12,6 +15,75 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Module-level aliases: hot loops bind these as locals/globals instead
+# of walking class attributes per lookup
+_STATUS_WEIGHTS = Application.STATUS_WEIGHTS
+_get_weight = _STATUS_WEIGHTS.get
+
+# Stable small-int index per status, in VALID_STATUSES order
+_STATUS_IDX = {status: i for i, status in enumerate(Application.VALID_STATUSES)}
+
+
+def _build_transition_mask() -> int:
+    """
+    Precompute transition legality as a 36-bit reachability mask.
+
+    Bit (from_idx * 6 + to_idx) is set when the transition is allowed:
+    anything may move to Dropped, nothing may leave Dropped, and
+    otherwise the status weight must not decrease. can_transition then
+    answers with one shift-and-AND instead of re-deriving the rules.
+    """
+    mask = 0
+    for frm, i in _STATUS_IDX.items():
+        for to, j in _STATUS_IDX.items():
+            if to == Application.STATUS_DROPPED:
+                legal = True
+            elif frm == Application.STATUS_DROPPED:
+                legal = False
+            else:
+                legal = _STATUS_WEIGHTS[to] >= _STATUS_WEIGHTS[frm]
+            if legal:
+                mask |= 1 << (i * 6 + j)
+    return mask
+
+
+_TRANSITION_MASK = _build_transition_mask()
+
+# Month lookup keyed on lowercase 3-letter prefixes; collapses abbreviated
+# and full month names into a single probe in the parsing hot path
+_MONTH_LUT = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+# Inverse lookup for formatting parsed intakes back to "Mon YYYY"
+_MONTH_NUM_TO_ABBR = {num: abbr.title() for abbr, num in _MONTH_LUT.items()}
+
+# Sort key produced for unparseable intakes: (9999, 12) as year*12+month
+_INVALID_SORTKEY = 9999 * 12 + 12
+
+# "<Month> <4-digit year>" with optional surrounding whitespace; one
+# compiled match replaces the strip/split/int chain
+_INTAKE_RE = re.compile(r"^\s*([A-Za-z]{3,9})\s+(\d{4})\s*$")
+
+
+def _format_intake(date_tuple: Optional[Tuple[int, int]]) -> Optional[str]:
+    """Format a parsed (year, month) tuple back to a "Mon YYYY" string."""
+    if not date_tuple:
+        return None
+    year, month = date_tuple
+    return f"{_MONTH_NUM_TO_ABBR.get(month, 'Unknown')} {year}"
+
 
 class StatusCalculator:
     """
@@ -26,6 +98,10 @@ class StatusCalculator:
     # Status weights from Application model
     STATUS_WEIGHTS = Application.STATUS_WEIGHTS
 
+    # Statuses ordered by weight, computed once; tuple so callers cannot
+    # mutate the shared cache
+    _PROGRESSION = tuple(sorted(STATUS_WEIGHTS.keys(), key=STATUS_WEIGHTS.get))
+
     # Month order for intake comparison
     MONTH_ORDER = {
         "Jan": 1,
@@ -73,44 +149,7 @@ class StatusCalculator:
         if not intake:
             return (9999, 12)  # Far future for null/invalid intakes
 
-        try:
-            intake_clean = intake.strip()
-            parts = intake_clean.split()
-
-            if len(parts) < 2:
-                logger.warning(f"Invalid intake format: {intake}")
-                return (9999, 12)
-
-            # Handle both abbreviated and full month names
-            month_str = parts[0]
-            year_str = parts[-1]  # Take last part as year
-
-            # Try to match month (first 3 chars for abbreviation)
-            month_key = month_str[:3].capitalize()
-            if month_key not in cls.MONTH_ORDER:
-                # Try full month name
-                month_key = month_str.capitalize()
-                if month_key not in cls.MONTH_ORDER:
-                    logger.warning(f"Invalid month in intake: {month_str}")
-                    return (9999, 12)
-
-            month_num = cls.MONTH_ORDER[month_key]
-
-            # Parse year
-            try:
-                year = int(year_str)
-                if year < 2000 or year > 2100:  # Sanity check
-                    logger.warning(f"Invalid year in intake: {year_str}")
-                    return (9999, 12)
-            except ValueError:
-                logger.warning(f"Invalid year format in intake: {year_str}")
-                return (9999, 12)
-
-            return (year, month_num)
-
-        except Exception as e:
-            logger.error(f"Error parsing intake date '{intake}': {e}")
-            return (9999, 12)
+        return _parse_intake_date_cached(intake)
 
     @classmethod
     def is_intake_earlier(cls, intake1: str, intake2: str) -> bool:
@@ -128,6 +167,35 @@ class StatusCalculator:
         date2 = cls.parse_intake_date(intake2)
         return date1 < date2
 
+    @classmethod
+    def pack_rank_key(
+        cls, status: str, intake: str, intake_sortkey: Optional[int] = None
+    ) -> int:
+        """
+        Pack an application's rank into a single comparable integer.
+
+        The status weight occupies the high bits and the *inverted*
+        intake sortkey (year*12+month) the low 24 bits, so a plain
+        integer max() picks "highest status, earliest intake on ties"
+        without any branching:
+
+            key = (weight << 24) | (INVALID_SORTKEY - sortkey)
+
+        Args:
+            status: Application status string
+            intake: Intake string, parsed only when no sortkey is given
+            intake_sortkey: Persisted year*12+month, if available
+
+        Returns:
+            Integer where greater means better-ranked
+        """
+        if intake_sortkey is None:
+            year, month = cls.parse_intake_date(intake)
+            intake_sortkey = year * 12 + month
+        return (_get_weight(status, 0) << 24) | (
+            _INVALID_SORTKEY - intake_sortkey
+        )
+
     @classmethod
     def calculate_highest_status(
         cls, applications: List[Application]
@@ -150,7 +218,7 @@ class StatusCalculator:
         Returns:
             Dictionary with 'highest_status' and 'highest_intake'
         """
-        logger.debug(f"Calculating highest status for {len(applications)} applications")
+        logger.debug("Calculating highest status for %d applications", len(applications))
 
         # Edge Case 1: No applications at all
         if not applications:
@@ -171,44 +239,47 @@ class StatusCalculator:
             )
             return {"highest_status": None, "highest_intake": None}
 
-        # Find the maximum weight among active applications
-        max_weight = max(
-            cls.STATUS_WEIGHTS.get(app.status, 0) for app in active_applications
+        # Branchless single pass: weight and (inverted) intake sortkey
+        # are packed into one integer so the builtin max() - a C-level
+        # loop - replaces the explicit weight/tie-breaker branches.
+        pack = cls.pack_rank_key
+        best_app = max(
+            active_applications,
+            key=lambda app: pack(app.status, app.intake, app.intake_sortkey),
         )
 
-        logger.debug(f"Maximum status weight found: {max_weight}")
+        logger.debug(
+            "Selected best application: %s - %s", best_app.status, best_app.intake
+        )
 
-        # Get all applications with the highest weight
-        best_applications = [
-            app
-            for app in active_applications
-            if cls.STATUS_WEIGHTS.get(app.status, 0) == max_weight
-        ]
+        return {"highest_status": best_app.status, "highest_intake": best_app.intake}
 
-        # Edge Case 3: Single application with highest status
-        if len(best_applications) == 1:
-            best_app = best_applications[0]
-            logger.debug(
-                f"Single best application: {best_app.status} - {best_app.intake}"
-            )
-            return {
-                "highest_status": best_app.status,
-                "highest_intake": best_app.intake,
-            }
+    @classmethod
+    def calculate_highest_from_columns(
+        cls, rows: List[Tuple[str, str]]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Column-oriented variant of calculate_highest_status for bulk
+        recomputes.
 
-        # Edge Case 4: Multiple applications with same highest status
-        # Apply tie-breaker: choose the earliest intake
-        logger.debug(f"Multiple applications with same status - applying tie-breaker")
+        Works on plain (status, intake) tuples instead of ORM instances,
+        so full-database recomputes can fetch columns with a Core query
+        and skip object hydration entirely.
 
-        best_app = min(
-            best_applications, key=lambda app: cls.parse_intake_date(app.intake)
-        )
+        Args:
+            rows: (status, intake) tuples for one student's non-deleted
+                applications
 
-        logger.debug(
-            f"Selected application after tie-breaker: {best_app.status} - {best_app.intake}"
-        )
+        Returns:
+            Dictionary with 'highest_status' and 'highest_intake'
+        """
+        pack = cls.pack_rank_key
+        active = [row for row in rows if row[0] != "Dropped"]
+        if not active:
+            return {"highest_status": None, "highest_intake": None}
 
-        return {"highest_status": best_app.status, "highest_intake": best_app.intake}
+        best_status, best_intake = max(active, key=lambda row: pack(row[0], row[1]))
+        return {"highest_status": best_status, "highest_intake": best_intake}
 
     @classmethod
     def update_student_highest_status(cls, student_id: int) -> Dict[str, Any]:
@@ -226,58 +297,60 @@ class StatusCalculator:
         Returns:
             Dictionary with update results and new values
         """
-        logger.info(f"Updating highest status for student {student_id}")
+        logger.info("Updating highest status for student %s", student_id)
 
         try:
-            # Start a database transaction for consistency
-            with db.session.begin_nested():
-                # Get the student
-                student = Student.query.get(student_id)
-                if not student:
-                    logger.error(f"Student {student_id} not found")
-                    return {"success": False, "error": "Student not found"}
-
-                # Get all applications for the student
-                applications = Application.query.filter_by(
-                    student_id=student_id, is_deleted=False
-                ).all()
-
-                logger.debug(
-                    f"Found {len(applications)} applications for student {student_id}"
-                )
+            # Single transaction: no SAVEPOINT needed, the commit below is
+            # atomic on its own and the except path rolls back
+            student = db.session.get(Student, student_id)
+            if not student:
+                logger.error("Student %s not found", student_id)
+                return {"success": False, "error": "Student not found"}
+
+            # Get all applications for the student
+            applications = Application.query.filter_by(
+                student_id=student_id, is_deleted=False
+            ).all()
 
-                # Calculate the new highest status
-                result = cls.calculate_highest_status(applications)
+            logger.debug(
+                "Found %d applications for student %s", len(applications), student_id
+            )
 
-                # Update the student record
-                old_status = student.highest_status
-                old_intake = student.highest_intake
+            # Calculate the new highest status
+            result = cls.calculate_highest_status(applications)
 
-                student.highest_status = result["highest_status"]
-                student.highest_intake = result["highest_intake"]
-                student.updated_at = datetime.utcnow()
+            # Update the student record
+            old_status = student.highest_status
+            old_intake = student.highest_intake
 
-                # Commit the transaction
-                db.session.commit()
+            student.highest_status = result["highest_status"]
+            student.highest_intake = result["highest_intake"]
+            student.updated_at = datetime.utcnow()
 
-                logger.info(
-                    f"Updated student {student_id}: "
-                    f"status '{old_status}' -> '{result['highest_status']}', "
-                    f"intake '{old_intake}' -> '{result['highest_intake']}'"
-                )
+            # Commit the transaction
+            db.session.commit()
 
-                return {
-                    "success": True,
-                    "student_id": student_id,
-                    "old_status": old_status,
-                    "old_intake": old_intake,
-                    "new_status": result["highest_status"],
-                    "new_intake": result["highest_intake"],
-                    "applications_count": len(applications),
-                }
+            logger.info(
+                "Updated student %s: status %r -> %r, intake %r -> %r",
+                student_id,
+                old_status,
+                result["highest_status"],
+                old_intake,
+                result["highest_intake"],
+            )
+
+            return {
+                "success": True,
+                "student_id": student_id,
+                "old_status": old_status,
+                "old_intake": old_intake,
+                "new_status": result["highest_status"],
+                "new_intake": result["highest_intake"],
+                "applications_count": len(applications),
+            }
 
         except Exception as e:
-            logger.error(f"Error updating student {student_id} highest status: {e}")
+            logger.error("Error updating student %s highest status: %s", student_id, e)
             db.session.rollback()
             return {"success": False, "error": str(e)}
 
@@ -292,25 +365,182 @@ class StatusCalculator:
         Returns:
             Dictionary with update results
         """
-        logger.info(f"Bulk updating {len(student_ids)} students")
+        logger.info("Bulk updating %d students", len(student_ids))
 
         results = {"success": 0, "failed": 0, "errors": []}
 
-        for student_id in student_ids:
-            result = cls.update_student_highest_status(student_id)
-            if result["success"]:
-                results["success"] += 1
-            else:
-                results["failed"] += 1
-                results["errors"].append(
-                    {"student_id": student_id, "error": result.get("error")}
+        if not student_ids:
+            return results
+
+        try:
+            # Two queries for the whole batch instead of two per student;
+            # both come back as plain column tuples, skipping ORM
+            # hydration for the reduction
+            found_ids = {
+                row[0]
+                for row in db.session.query(Student.id).filter(
+                    Student.id.in_(student_ids)
+                )
+            }
+            application_rows = (
+                db.session.query(
+                    Application.student_id, Application.status, Application.intake
+                )
+                .filter(
+                    Application.student_id.in_(student_ids),
+                    Application.is_deleted == False,
                 )
+                .all()
+            )
+
+            # Group (status, intake) rows by student in one pass
+            apps_by_student: Dict[int, List[Tuple[str, str]]] = {}
+            for sid, status, intake in application_rows:
+                apps_by_student.setdefault(sid, []).append((status, intake))
+
+            updates = []
+            for student_id in student_ids:
+                if student_id not in found_ids:
+                    results["failed"] += 1
+                    results["errors"].append(
+                        {"student_id": student_id, "error": "Student not found"}
+                    )
+                    continue
+                result = cls.calculate_highest_from_columns(
+                    apps_by_student.get(student_id, [])
+                )
+                updates.append(
+                    (student_id, result["highest_status"], result["highest_intake"])
+                )
+                results["success"] += 1
+
+            # One executemany UPDATE + commit for the whole batch
+            cls.bulk_persist(updates)
+
+        except Exception as e:
+            logger.error("Bulk update failed: %s", e)
+            db.session.rollback()
+            results["failed"] += results["success"]
+            results["success"] = 0
+            results["errors"].append({"student_id": None, "error": str(e)})
 
         logger.info(
-            f"Bulk update completed: {results['success']} success, {results['failed']} failed"
+            "Bulk update completed: %d success, %d failed",
+            results["success"],
+            results["failed"],
         )
         return results
 
+    @classmethod
+    def bulk_persist(cls, rows: List[Tuple[int, Optional[str], Optional[str]]]) -> None:
+        """
+        Persist precomputed (student_id, highest_status, highest_intake)
+        rows with a single executemany UPDATE keyed on primary key.
+
+        The driver sends the whole batch in one roundtrip (psycopg2
+        batches the statement; SQLite runs it as one executemany), so
+        no per-student flushes or ORM instances are involved.
+
+        Args:
+            rows: Tuples of (student_id, highest_status, highest_intake)
+        """
+        if not rows:
+            return
+
+        now = datetime.utcnow()
+        db.session.execute(
+            db.update(Student),
+            [
+                {
+                    "id": student_id,
+                    "highest_status": highest_status,
+                    "highest_intake": highest_intake,
+                    "updated_at": now,
+                }
+                for student_id, highest_status, highest_intake in rows
+            ],
+        )
+        db.session.commit()
+
+    @classmethod
+    def recompute_all_sql(cls) -> int:
+        """
+        Recompute every student's highest status in the database.
+
+        One UPDATE with a window-function subquery replaces loading all
+        applications into Python: ROW_NUMBER() partitioned by student and
+        ordered by (weight DESC, year ASC, month ASC) picks each
+        student's best application in-database. Students with no active
+        applications are reset to NULL.
+
+        Returns:
+            Number of student rows updated
+        """
+        # db.case() only recognizes plain dicts, not the read-only proxy
+        weight_expr = db.case(
+            dict(cls.STATUS_WEIGHTS), value=Application.status, else_=0
+        )
+        month_expr = db.case(
+            _MONTH_LUT,
+            value=db.func.lower(db.func.substr(Application.intake, 1, 3)),
+            else_=12,
+        )
+        # Intakes are validated as "<Month> <4-digit year>", so the year is
+        # always the last four characters (substr/length work on both
+        # SQLite and Postgres)
+        year_expr = db.cast(
+            db.func.substr(
+                Application.intake, db.func.length(Application.intake) - 3, 4
+            ),
+            db.Integer,
+        )
+
+        # Prefer the persisted sortkey; derive it from the string only for
+        # rows that predate the column
+        sortkey_expr = db.func.coalesce(
+            Application.intake_sortkey, year_expr * 12 + month_expr
+        )
+
+        ranked = (
+            db.select(
+                Application.student_id.label("student_id"),
+                Application.status.label("status"),
+                Application.intake.label("intake"),
+                db.func.row_number()
+                .over(
+                    partition_by=Application.student_id,
+                    order_by=[
+                        weight_expr.desc(),
+                        sortkey_expr.asc(),
+                    ],
+                )
+                .label("rn"),
+            ).where(
+                Application.is_deleted == False,
+                Application.status != "Dropped",
+            )
+        ).subquery()
+
+        best = db.select(ranked).where(ranked.c.rn == 1).subquery()
+
+        result = db.session.execute(
+            db.update(Student)
+            .where(Student.is_deleted == False)
+            .values(
+                highest_status=db.select(best.c.status)
+                .where(best.c.student_id == Student.id)
+                .scalar_subquery(),
+                highest_intake=db.select(best.c.intake)
+                .where(best.c.student_id == Student.id)
+                .scalar_subquery(),
+                updated_at=datetime.utcnow(),
+            )
+        )
+        db.session.commit()
+
+        logger.info("SQL recompute updated %d students", result.rowcount)
+        return result.rowcount
+
     @classmethod
     def validate_status(cls, status: str) -> bool:
         """
@@ -353,17 +583,17 @@ class StatusCalculator:
         Returns:
             Weight of the status (0 if invalid)
         """
-        return cls.STATUS_WEIGHTS.get(status, 0)
+        return _get_weight(status, 0)
 
     @classmethod
-    def get_status_progression(cls) -> List[str]:
+    def get_status_progression(cls) -> Tuple[str, ...]:
         """
-        Get the list of statuses in order of progression.
+        Get the statuses in order of progression.
 
         Returns:
-            List of statuses ordered by weight
+            Tuple of statuses ordered by weight (precomputed)
         """
-        return sorted(cls.STATUS_WEIGHTS.keys(), key=lambda s: cls.STATUS_WEIGHTS[s])
+        return cls._PROGRESSION
 
     @classmethod
     def can_transition(cls, current_status: str, new_status: str) -> bool:
@@ -377,19 +607,22 @@ class StatusCalculator:
         Returns:
             True if transition is allowed
         """
-        # Can always drop an application
-        if new_status == "Dropped":
-            return True
-
-        # Can't transition from dropped
-        if current_status == "Dropped":
-            return False
-
-        # Can only move forward or stay same
-        current_weight = cls.get_status_weight(current_status)
-        new_weight = cls.get_status_weight(new_status)
+        i = _STATUS_IDX.get(current_status)
+        j = _STATUS_IDX.get(new_status)
+
+        if i is None or j is None:
+            # Unknown statuses fall back to the explicit rules (their
+            # weight defaults to 0)
+            if new_status == "Dropped":
+                return True
+            if current_status == "Dropped":
+                return False
+            return cls.get_status_weight(new_status) >= cls.get_status_weight(
+                current_status
+            )
 
-        return new_weight >= current_weight
+        # One shift-and-AND against the precomputed reachability mask
+        return bool(_TRANSITION_MASK >> (i * 6 + j) & 1)
 
     @classmethod
     def get_statistics(cls, student_id: int) -> Dict[str, Any]:
@@ -402,11 +635,16 @@ class StatusCalculator:
         Returns:
             Dictionary with application statistics
         """
-        applications = Application.query.filter_by(
-            student_id=student_id, is_deleted=False
-        ).all()
+        # Column tuples only - statistics never need full ORM instances
+        application_rows = (
+            db.session.query(
+                Application.status, Application.intake, Application.intake_sortkey
+            )
+            .filter_by(student_id=student_id, is_deleted=False)
+            .all()
+        )
 
-        if not applications:
+        if not application_rows:
             return {
                 "total_applications": 0,
                 "active_applications": 0,
@@ -416,49 +654,80 @@ class StatusCalculator:
                 "latest_intake": None,
             }
 
-        status_breakdown = {}
-        active_count = 0
-        dropped_count = 0
-        intakes = []
-
-        for app in applications:
-            # Count by status
-            status_breakdown[app.status] = status_breakdown.get(app.status, 0) + 1
-
-            # Count active vs dropped
-            if app.status == "Dropped":
-                dropped_count += 1
-            else:
-                active_count += 1
-
-            # Collect intakes
-            intakes.append(cls.parse_intake_date(app.intake))
+        # Count statuses in C via Counter
+        status_breakdown = dict(Counter(row[0] for row in application_rows))
+        dropped_count = status_breakdown.get("Dropped", 0)
+        active_count = len(application_rows) - dropped_count
+
+        # Use the persisted integer sort key where available; only rows
+        # predating the column need a (cached) string parse
+        parse_intake = cls.parse_intake_date
+        sortkeys = []
+        for _, intake, sortkey in application_rows:
+            if sortkey is None:
+                year, month = parse_intake(intake)
+                sortkey = year * 12 + month
+            if sortkey != _INVALID_SORTKEY:
+                sortkeys.append(sortkey)
+
+        # Two scalar columns instead of hydrating the whole Student row
+        student_row = (
+            db.session.query(Student.highest_status, Student.highest_intake)
+            .filter_by(id=student_id)
+            .first()
+        )
 
-        # Find earliest and latest intakes
-        intakes = [i for i in intakes if i != (9999, 12)]  # Filter invalid
-        earliest = min(intakes) if intakes else None
-        latest = max(intakes) if intakes else None
+        earliest = min(sortkeys) if sortkeys else None
+        latest = max(sortkeys) if sortkeys else None
 
-        # Format intake dates back to string
-        def format_intake(date_tuple):
-            if not date_tuple:
+        def sortkey_to_tuple(sortkey):
+            if sortkey is None:
                 return None
-            year, month = date_tuple
-            month_names = {v: k for k, v in cls.MONTH_ORDER.items() if len(k) == 3}
-            month_name = month_names.get(month, "Unknown")
-            return f"{month_name} {year}"
+            year, month = divmod(sortkey - 1, 12)
+            return (year, month + 1)
 
         return {
-            "total_applications": len(applications),
+            "total_applications": len(application_rows),
             "active_applications": active_count,
             "dropped_applications": dropped_count,
             "status_breakdown": status_breakdown,
-            "earliest_intake": format_intake(earliest),
-            "latest_intake": format_intake(latest),
-            "highest_status": Student.query.get(student_id).highest_status,
-            "highest_intake": Student.query.get(student_id).highest_intake,
+            "earliest_intake": _format_intake(sortkey_to_tuple(earliest)),
+            "latest_intake": _format_intake(sortkey_to_tuple(latest)),
+            "highest_status": student_row[0] if student_row else None,
+            "highest_intake": student_row[1] if student_row else None,
         }
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_intake_date_cached(intake: str) -> Tuple[int, int]:
+    """
+    Cached intake parser backing StatusCalculator.parse_intake_date.
+
+    Intake strings come from a tiny bounded vocabulary ("Sep 2026", ...),
+    so memoizing at module level turns repeat parses during tie-breaking,
+    statistics and bulk updates into a single dict lookup. Module-level
+    because lru_cache on a classmethod would key on cls as well.
+    """
+    match = _INTAKE_RE.match(intake)
+    if not match:
+        logger.warning("Invalid intake format: %s", intake)
+        return (9999, 12)
+
+    # One probe on the lowercase 3-letter prefix handles both "Sep" and
+    # "September" - no capitalize/retry dance
+    month_num = _MONTH_LUT.get(match.group(1)[:3].lower())
+    if month_num is None:
+        logger.warning("Invalid month in intake: %s", match.group(1))
+        return (9999, 12)
+
+    # The regex guarantees a 4-digit year, so int() cannot fail
+    year = int(match.group(2))
+    if year < 2000 or year > 2100:  # Sanity check
+        logger.warning("Invalid year in intake: %s", match.group(2))
+        return (9999, 12)
+
+    return (year, month_num)
+
+
 # Create a singleton instance
 status_calculator = StatusCalculator()
@@ -15,19 +15,23 @@ from datetime import datetime
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from app import create_app
-from app.models import db, Student, Application
-from app.factories import DataFactory, StudentFactory, ApplicationFactory
+# App imports are deferred into the command functions: argparse and
+# --help need none of Flask/SQLAlchemy, and deferring also lets main()
+# set the DATABASE_URL default before config is read at import time.
 
 
 def setup_app():
     """Set up Flask application context."""
+    from app import create_app
+
     app = create_app()
     return app
 
 
 def create_sample_data(args):
     """Create sample data."""
+    from app.factories import DataFactory
+
     with setup_app().app_context():
         if args.scenario == 'realistic':
             result = DataFactory.create_realistic_scenario()
@@ -48,26 +52,57 @@ def create_sample_data(args):
 
 
 def export_data(args):
-    """Export data to JSON file."""
+    """Export data to JSON file, streaming records in batches."""
+    from app.models import Student, Application
+
     with setup_app().app_context():
-        data = DataFactory.export_data_to_dict()
-        
         # Generate filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = args.output or f"student_data_export_{timestamp}.json"
-        
-        # Write to file
+
+        total_students = Student.query.filter_by(is_deleted=False).count()
+        total_applications = Application.query.filter_by(is_deleted=False).count()
+        export_timestamp = datetime.utcnow().isoformat()
+
+        # Stream the export instead of materializing the full dict: records
+        # are written as they come off the cursor, keeping memory at
+        # O(batch) instead of O(dataset)
+        def write_array(f, query, serialize):
+            f.write('[')
+            first = True
+            for record in query.yield_per(500):
+                f.write('\n' if first else ',\n')
+                f.write(json.dumps(serialize(record), default=str))
+                first = False
+            f.write('\n]' if not first else ']')
+
         with open(filename, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
-        
+            f.write('{\n"students": ')
+            write_array(
+                f,
+                Student.query_with_apps().filter_by(is_deleted=False),
+                lambda s: s.to_dict(include_applications=True)
+            )
+            f.write(',\n"applications": ')
+            write_array(
+                f,
+                Application.query.filter_by(is_deleted=False),
+                lambda a: a.to_dict()
+            )
+            f.write(',\n"export_timestamp": %s' % json.dumps(export_timestamp))
+            f.write(',\n"total_students": %d' % total_students)
+            f.write(',\n"total_applications": %d\n}\n' % total_applications)
+
         print(f"\n📁 Data exported to: {filename}")
-        print(f"   Students: {data['total_students']}")
-        print(f"   Applications: {data['total_applications']}")
-        print(f"   Export time: {data['export_timestamp']}")
+        print(f"   Students: {total_students}")
+        print(f"   Applications: {total_applications}")
+        print(f"   Export time: {export_timestamp}")
 
 
 def import_data(args):
     """Import data from JSON file."""
+    from app.models import Student, Application
+
     with setup_app().app_context():
         if not os.path.exists(args.file):
             print(f"❌ File not found: {args.file}")
@@ -86,15 +121,15 @@ def import_data(args):
                 print("Import cancelled.")
                 return
         
-        # Import students
-        students_imported = 0
-        applications_imported = 0
-        student_id_mapping = {}  # Map old IDs to new IDs
-        
+        # Prepare students for a single batched insert instead of one
+        # INSERT + commit per record
+        old_ids = []
+        student_dicts = []
+
         for student_data in data.get('students', []):
             # Store the old ID before removing it
-            old_id = student_data.get('id')
-            
+            old_ids.append(student_data.get('id'))
+
             # Remove fields that shouldn't be set during creation
             student_data.pop('id', None)
             student_data.pop('created_at', None)
@@ -104,26 +139,51 @@ def import_data(args):
             student_data.pop('total_applications_count', None)  # Computed field
             student_data.pop('has_active_applications', None)  # Computed field
             student_data.pop('display_name', None)  # Computed field
-            
+
             # Handle None values for optional fields
             if 'notes' not in student_data:
                 student_data['notes'] = None
-            
-            try:
-                student = Student(**student_data)
-                student.save()
-                students_imported += 1
-                
-                # Map old ID to new ID
-                if old_id is not None:
-                    student_id_mapping[old_id] = student.id
-                    
-            except Exception as e:
-                print(f"Error creating student {student_data.get('name', 'Unknown')}: {e}")
-                print(f"Student data: {student_data}")
-                raise
-        
-        # Import applications
+
+            student_dicts.append(student_data)
+
+        # Screen the whole batch against registered emails with one IN
+        # query; a duplicate then skips its own row with a message
+        # instead of aborting the entire batched insert
+        existing_emails = Student.find_existing_emails(
+            [d.get('email') for d in student_dicts]
+        )
+        if existing_emails:
+            kept_ids = []
+            kept_dicts = []
+            for old_id, student_data in zip(old_ids, student_dicts):
+                if student_data.get('email') in existing_emails:
+                    print(f"Warning: Student with email {student_data.get('email')} already exists, skipping")
+                    continue
+                kept_ids.append(old_id)
+                kept_dicts.append(student_data)
+            old_ids = kept_ids
+            student_dicts = kept_dicts
+
+        try:
+            students = Student.bulk_create(student_dicts)
+        except Exception as e:
+            print(f"Error importing students: {e}")
+            raise
+
+        students_imported = len(students)
+
+        # Map old IDs to new IDs (bulk_create preserves input order)
+        student_id_mapping = {
+            old_id: student.id
+            for old_id, student in zip(old_ids, students)
+            if old_id is not None
+        }
+
+        # Prepare applications the same way, grouping (status, intake) per
+        # new student ID so the status recompute can run on data already
+        # in memory instead of re-querying it
+        application_dicts = []
+        apps_by_new_student_id = {}
         for application_data in data.get('applications', []):
             # Map old student ID to new student ID
             old_student_id = application_data.get('student_id')
@@ -132,7 +192,7 @@ def import_data(args):
             else:
                 print(f"Warning: No mapping found for student_id {old_student_id}, skipping application")
                 continue
-            
+
             # Remove fields that shouldn't be set during creation
             application_data.pop('id', None)
             application_data.pop('created_at', None)
@@ -140,27 +200,41 @@ def import_data(args):
             application_data.pop('status_weight', None)  # Computed field
             application_data.pop('is_active', None)  # Computed field
             application_data.pop('is_successful', None)  # Computed field
-            
+
+            application_dicts.append(application_data)
+            apps_by_new_student_id.setdefault(
+                application_data['student_id'], []
+            ).append((application_data.get('status'), application_data.get('intake')))
+
+        try:
+            applications_imported = len(Application.bulk_create(application_dicts))
+        except Exception as e:
+            print(f"Error importing applications: {e}")
+            raise
+
+        # Compute each imported student's highest status from the rows we
+        # just built (no re-query), then persist all of them with a single
+        # executemany UPDATE instead of a query-and-commit loop per student
+        if not args.no_status_update:
+            from app import db
+            from app.services.status_calculator import StatusCalculator
             try:
-                application = Application(**application_data)
-                application.save()
-                applications_imported += 1
+                updates = []
+                for new_student_id, rows in apps_by_new_student_id.items():
+                    result = StatusCalculator.calculate_highest_from_columns(rows)
+                    updates.append({
+                        'id': new_student_id,
+                        'highest_status': result['highest_status'],
+                        'highest_intake': result['highest_intake'],
+                    })
+                if updates:
+                    db.session.execute(db.update(Student), updates)
+                    db.session.commit()
             except Exception as e:
-                print(f"Error creating application: {e}")
-                print(f"Application data: {application_data}")
+                db.session.rollback()
+                print(f"Error updating student statuses: {e}")
                 raise
         
-        # Update student statuses
-        if not args.no_status_update:
-            from app.services.status_calculator import StatusCalculator
-            students = Student.query.filter_by(is_deleted=False).all()
-            for student in students:
-                try:
-                    StatusCalculator.update_student_highest_status(student.id)
-                except Exception as e:
-                    print(f"Error updating status for student {student.name}: {e}")
-                    raise
-        
         print(f"\n✅ Import completed:")
         print(f"   Students imported: {students_imported}")
         print(f"   Applications imported: {applications_imported}")
@@ -170,6 +244,9 @@ def import_data(args):
 
 def clear_data(args):
     """Clear all data from database."""
+    from app.models import Student, Application
+    from app.factories import DataFactory
+
     with setup_app().app_context():
         # Get current counts
         student_count = Student.query.filter_by(is_deleted=False).count()
@@ -198,6 +275,8 @@ def clear_data(args):
 
 def show_stats(args):
     """Show database statistics."""
+    from app.models import Student, Application
+
     with setup_app().app_context():
         student_count = Student.query.filter_by(is_deleted=False).count()
         application_count = Application.query.filter_by(is_deleted=False).count()
@@ -0,0 +1,37 @@
+"""Partial unique index on active student emails
+
+Revision ID: a41c09d3be72
+Revises: f790d5274c68
+Create Date: 2026-08-29 10:12:03.511274
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a41c09d3be72"
+down_revision = "f790d5274c68"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("students", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_students_email"))
+        batch_op.create_index(batch_op.f("ix_students_email"), ["email"], unique=False)
+        batch_op.create_index(
+            "uq_student_email_active",
+            ["email"],
+            unique=True,
+            postgresql_where=sa.text("is_deleted = false"),
+            sqlite_where=sa.text("is_deleted = 0"),
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("students", schema=None) as batch_op:
+        batch_op.drop_index("uq_student_email_active")
+        batch_op.drop_index(batch_op.f("ix_students_email"))
+        batch_op.create_index(batch_op.f("ix_students_email"), ["email"], unique=True)
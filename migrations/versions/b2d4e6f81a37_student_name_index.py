@@ -0,0 +1,26 @@
+"""Add index on students.name for search and sort paths
+
+Revision ID: b2d4e6f81a37
+Revises: e7b30a1c4f85
+Create Date: 2026-08-29 18:40:11.902317
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b2d4e6f81a37"
+down_revision = "e7b30a1c4f85"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("students", schema=None) as batch_op:
+        batch_op.create_index("idx_student_name", ["name"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("students", schema=None) as batch_op:
+        batch_op.drop_index("idx_student_name")
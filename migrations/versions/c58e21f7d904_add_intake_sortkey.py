@@ -0,0 +1,60 @@
+"""Add intake_sortkey column to applications
+
+Revision ID: c58e21f7d904
+Revises: a41c09d3be72
+Create Date: 2026-08-29 11:05:41.902116
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c58e21f7d904"
+down_revision = "a41c09d3be72"
+branch_labels = None
+depends_on = None
+
+
+# Month abbreviation -> number CASE for the backfill
+_MONTH_CASE = """
+CASE lower(substr(intake, 1, 3))
+    WHEN 'jan' THEN 1 WHEN 'feb' THEN 2 WHEN 'mar' THEN 3
+    WHEN 'apr' THEN 4 WHEN 'may' THEN 5 WHEN 'jun' THEN 6
+    WHEN 'jul' THEN 7 WHEN 'aug' THEN 8 WHEN 'sep' THEN 9
+    WHEN 'oct' THEN 10 WHEN 'nov' THEN 11 WHEN 'dec' THEN 12
+    ELSE 12
+END
+"""
+
+
+def upgrade():
+    with op.batch_alter_table("applications", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "intake_sortkey",
+                sa.Integer(),
+                nullable=True,
+                comment="Parsed intake as year*12+month for integer comparisons",
+            )
+        )
+        batch_op.create_index(
+            batch_op.f("ix_applications_intake_sortkey"),
+            ["intake_sortkey"],
+            unique=False,
+        )
+
+    # Backfill existing rows in one UPDATE (year is the trailing 4 chars of
+    # the validated "<Month> <YYYY>" format)
+    op.execute(
+        "UPDATE applications SET intake_sortkey = "
+        "CAST(substr(intake, length(intake) - 3, 4) AS INTEGER) * 12 + "
+        + _MONTH_CASE
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("applications", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_applications_intake_sortkey"))
+        batch_op.drop_column("intake_sortkey")
@@ -0,0 +1,30 @@
+"""Add covering index for student/is_deleted application lookups
+
+Revision ID: e7b30a1c4f85
+Revises: c58e21f7d904
+Create Date: 2026-08-29 12:18:27.441053
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "e7b30a1c4f85"
+down_revision = "c58e21f7d904"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("applications", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_app_student_active",
+            ["student_id", "is_deleted", "status", "intake_sortkey"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("applications", schema=None) as batch_op:
+        batch_op.drop_index("ix_app_student_active")
@@ -2,6 +2,9 @@
 """
 Test Runner Script for Student Platform API
 Provides easy commands to run different types of tests.
+
+Tests shard across all cores by default (requires pytest-xdist; pass
+--parallel 0 to force a serial run).
 """
 
 import os
@@ -14,16 +17,57 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Per-test-type pytest selection arguments, shared by collection
+# counting and command construction
+SELECTORS = {
+    "all": [],
+    "unit": ["-m", "unit"],
+    "integration": ["-m", "integration"],
+    "api": ["-m", "api"],
+    "model": ["-m", "model"],
+    "service": ["-m", "service"],
+    "coverage": [],
+    "fast": ["-m", "not slow"],
+    "slow": ["-m", "slow"],
+    "examples": ["-m", "example"],
+    "students": ["tests/test_students.py"],
+    "applications": ["tests/test_applications.py"],
+    "status": ["tests/test_status_calculator.py"],
+}
+
+
+def collected_test_count(test_type):
+    """Count the tests a selection would run.
+
+    A failed collection aborts the runner instead of being mistaken
+    for a small selection (exit code 5, no tests collected, is fine).
+    """
+    result = subprocess.run(
+        ["pytest", "--collect-only", "-q", "--no-cov"]
+        + SELECTORS.get(test_type, []),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode not in (0, 5):
+        print(f"❌ Test collection failed (exit code {result.returncode}):")
+        print(result.stdout)
+        print(result.stderr, file=sys.stderr)
+        sys.exit(result.returncode)
+    return sum(1 for line in result.stdout.splitlines() if "::" in line)
+
+
 def run_command(command, description):
-    """Run a command and display the result."""
+    """Run an argv-list command and display the result."""
     print(f"\n{'='*60}")
     print(f"🧪 {description}")
     print(f"{'='*60}")
-    print(f"Running: {command}")
+    print(f"Running: {' '.join(command)}")
     print("-" * 60)
-    
+
     try:
-        result = subprocess.run(command, shell=True, check=True)
+        # argv list, no shell: skips the shell fork/parse and cannot be
+        # injected through arguments
+        result = subprocess.run(command, check=True)
         print(f"\n✅ {description} completed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -36,7 +80,8 @@ def main():
         "test_type",
         choices=[
             "all", "unit", "integration", "api", "model", "service",
-            "coverage", "fast", "slow", "students", "applications", "status"
+            "coverage", "fast", "slow", "examples", "students", "applications",
+            "status"
         ],
         help="Type of tests to run"
     )
@@ -53,47 +98,67 @@ def main():
     parser.add_argument(
         "--parallel", "-n",
         type=int,
-        default=0,
-        help="Number of parallel workers (0 to disable, requires pytest-xdist)"
+        default=-1,
+        help="Number of parallel workers (-1 for auto, 0 to disable, requires pytest-xdist)"
     )
-    
+    parser.add_argument(
+        "--dist",
+        default="worksteal",
+        help="pytest-xdist distribution mode (default: worksteal)"
+    )
+
     args = parser.parse_args()
     
     # Set environment variables
     os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
     os.environ.setdefault("FLASK_ENV", "testing")
     
-    # Base pytest command
-    base_cmd = "pytest"
-    
+    # Base pytest command as an argv list. Scripted runs never replay
+    # --lf/--ff, so skip the cache plugin's per-run .pytest_cache
+    # writes (plain `pytest` keeps it for last-failed workflows).
+    base_cmd = ["pytest", "-p", "no:cacheprovider"]
+
     # Add options based on arguments
     if args.verbose:
-        base_cmd += " -vv"
-    
+        base_cmd.append("-vv")
+
     if args.stop_on_fail:
-        base_cmd += " -x"
-    
-    if args.parallel > 0:
-        base_cmd += f" -n {args.parallel}"
-    
-    # Define test commands
-    commands = {
-        "all": f"{base_cmd}",
-        "unit": f"{base_cmd} -m unit",
-        "integration": f"{base_cmd} -m integration",
-        "api": f"{base_cmd} -m api",
-        "model": f"{base_cmd} -m model",
-        "service": f"{base_cmd} -m service",
-        "coverage": f"{base_cmd} --cov=app --cov-report=html --cov-report=term-missing",
-        "fast": f"{base_cmd} -m 'not slow'",
-        "slow": f"{base_cmd} -m slow",
-        "students": f"{base_cmd} tests/test_students.py",
-        "applications": f"{base_cmd} tests/test_applications.py",
-        "status": f"{base_cmd} tests/test_status_calculator.py"
-    }
-    
-    command = commands.get(args.test_type, f"{base_cmd}")
-    
+        base_cmd.append("-x")
+
+    # Parallel by default: each xdist worker gets its own in-memory SQLite
+    # database, so the suite shards cleanly across cores. For tiny
+    # selections the per-worker app bootstrap costs more than it saves,
+    # so auto mode stays serial below a small test-count threshold.
+    if args.parallel == -1:
+        if collected_test_count(args.test_type) > 16:
+            base_cmd += ["-n", "auto", "--dist", args.dist]
+        else:
+            # Override the -n auto default from pytest.ini
+            base_cmd += ["-n", "0"]
+    elif args.parallel > 0:
+        base_cmd += ["-n", str(args.parallel), "--dist", args.dist]
+    else:
+        base_cmd += ["-n", "0"]
+
+    # Non-coverage targets pass --no-cov so pytest-cov never installs a
+    # trace function, even if coverage options are configured globally
+    no_cov = base_cmd + ["--no-cov"]
+
+    # Build the command from the shared selector table
+    if args.test_type == "coverage":
+        command = base_cmd + [
+            "--cov=app",
+            "--cov-report=html",
+            "--cov-report=term-missing",
+        ]
+    else:
+        command = no_cov + SELECTORS.get(args.test_type, [])
+
+    if args.test_type == "coverage":
+        # coverage.py 7.4+ collects via PEP 669 monitoring instead of
+        # sys.settrace where the interpreter supports it
+        os.environ.setdefault("COVERAGE_CORE", "sysmon")
+
     # Run the tests
     success = run_command(command, f"Running {args.test_type} tests")
     
@@ -1,46 +1,128 @@
 """
 Test configuration and fixtures.
+
+The Flask app and schema are built once per session against an
+in-memory SQLite database on a StaticPool (one shared connection, no
+disk I/O); each test only pays for a table wipe in teardown instead of
+a full app + schema rebuild. Under pytest-xdist each worker is its own
+process and therefore gets its own private in-memory database.
 """
 
-import pytest
+import json
 import os
-import tempfile
+import sqlite3
+
+import pytest
+from sqlalchemy import event
+
+try:
+    import orjson
+except ImportError:  # optional, mirrors app/core/json.py
+    orjson = None
+
+# Must be set before the app package is imported because TestingConfig
+# reads it at class-definition time.
+os.environ["TEST_DATABASE_URL"] = "sqlite:///:memory:"
+os.environ.setdefault("APP_ENV", "testing")
+
 from app import create_app, db
 from app.models.student import Student
 from app.models.application import Application
 
 
-@pytest.fixture
-def app():
-    """Create and configure a new app instance for each test."""
-    # Create a temporary file to serve as the database
-    db_fd, db_path = tempfile.mkstemp()
-
-    # Create app with test configuration
-    app = create_app(
-        {
-            "TESTING": True,
-            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
-            "WTF_CSRF_ENABLED": False,
-            "SECRET_KEY": "test-secret-key",
-        }
-    )
-
-    # Create the database
+@pytest.fixture(scope="session")
+def _app():
+    """Create the app and schema once for the whole session."""
+    app = create_app("testing")
+
     with app.app_context():
+        if db.engine.dialect.name == "sqlite":
+            # No-ops for :memory: but shortcut the WAL machinery when
+            # TEST_DATABASE_URL is overridden back to a file database
+            @event.listens_for(db.engine, "connect")
+            def _sqlite_fast_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=MEMORY")
+                cursor.execute("PRAGMA synchronous=OFF")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.close()
+
         db.create_all()
 
     yield app
 
-    # Clean up
-    os.close(db_fd)
-    os.unlink(db_path)
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture(scope="session")
+def _schema_snapshot(_app):
+    """Blank-schema template database captured right after create_all.
+
+    Restoring it with sqlite3's backup() API is a binary page copy -
+    cheaper than per-table DELETEs or re-running the DDL.
+    """
+    snapshot = sqlite3.connect(":memory:", check_same_thread=False)
+
+    with _app.app_context():
+        raw = db.engine.raw_connection()
+        try:
+            raw.driver_connection.backup(snapshot)
+        finally:
+            raw.close()
+
+    yield snapshot
+    snapshot.close()
+
+
+@pytest.fixture
+def app(_app, _schema_snapshot):
+    """Per-test view of the shared app; data is wiped after each test."""
+    yield _app
+
+    # Overwrite the database with the blank-schema snapshot in one
+    # page-level copy
+    with _app.app_context():
+        db.session.remove()
+        raw = db.engine.raw_connection()
+        try:
+            _schema_snapshot.backup(raw.driver_connection)
+        finally:
+            raw.close()
+
+
+@pytest.fixture(autouse=True)
+def _ctx(app):
+    """Keep one app context pushed for the whole test.
+
+    Fixtures and test bodies share it instead of paying a context
+    push/pop (and the detached-instance dance) per database touch.
+    """
+    with app.app_context():
+        yield
+
+
+@pytest.fixture(scope="class")
+def client(_app):
+    """One test client shared per class.
+
+    Isolation does not depend on a fresh client: the autouse _ctx
+    fixture pulls in app, whose teardown restores the blank-schema
+    snapshot after every test. Note the shared client carries its
+    cookie jar across a class, which no current test relies on.
+    """
+    return _app.test_client()
 
 
 @pytest.fixture
-def client(app):
-    """A test client for the app."""
-    return app.test_client()
+def db_session(app):
+    """Session against the shared engine and schema.
+
+    No per-test engine or create_all: the app fixture restores the
+    blank-schema snapshot in teardown, which also rolls away anything
+    a test committed (including expected IntegrityError leftovers).
+    """
+    return db.session
 
 
 @pytest.fixture
@@ -49,15 +131,27 @@ def runner(app):
     return app.test_cli_runner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_student():
-    """Create a sample student for testing."""
+    """Sample student payload, shared per module (tests must not mutate)."""
     return {"name": "John Doe", "email": "john.doe@example.com", "phone": "+1234567890"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def sample_student_json(sample_student):
+    """sample_student serialized once per module for raw POST bodies.
+
+    Bytes, not str: Werkzeug sends them as-is instead of UTF-8
+    encoding the body on every request.
+    """
+    if orjson is not None:
+        return orjson.dumps(sample_student)
+    return json.dumps(sample_student).encode()
+
+
+@pytest.fixture(scope="module")
 def sample_application():
-    """Create a sample application for testing."""
+    """Sample application payload, shared per module (tests must not mutate)."""
     return {
         "university_name": "University of California",
         "program_name": "Computer Science",
@@ -67,20 +161,45 @@ def sample_application():
 
 
 @pytest.fixture
-def student_in_db(app, sample_student):
+def student_in_db(_ctx, sample_student):
     """Create a student in the database."""
-    with app.app_context():
-        student = Student(**sample_student)
-        db.session.add(student)
+    student = Student(**sample_student)
+    db.session.add(student)
+    db.session.commit()
+    return student
+
+
+@pytest.fixture
+def bulk_applications(_ctx, student_in_db):
+    """Factory that inserts N applications with one executemany INSERT.
+
+    Bypasses per-object ORM bookkeeping, so scale tests pay one
+    statement instead of N.
+    """
+
+    def _create(count, **overrides):
+        rows = [
+            {
+                "student_id": student_in_db.id,
+                "university_name": f"University {i}",
+                "program_name": f"Program {i}",
+                "intake": "Jan 2026",
+                "status": "Building Application",
+                **overrides,
+            }
+            for i in range(count)
+        ]
+        db.session.execute(Application.__table__.insert(), rows)
         db.session.commit()
-        return student
+        return rows
+
+    return _create
 
 
 @pytest.fixture
-def application_in_db(app, student_in_db, sample_application):
+def application_in_db(_ctx, student_in_db, sample_application):
     """Create an application in the database."""
-    with app.app_context():
-        application = Application(student_id=student_in_db.id, **sample_application)
-        db.session.add(application)
-        db.session.commit()
-        return application
+    application = Application(student_id=student_in_db.id, **sample_application)
+    db.session.add(application)
+    db.session.commit()
+    return application
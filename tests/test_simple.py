@@ -3,9 +3,31 @@ Simple Test Examples - Student Platform API
 Basic working tests that demonstrate testing patterns.
 """
 
+import re
+from functools import lru_cache
+
 import pytest
 
 
+# Compiled once at import: the regex engine scans in C instead of a
+# Python-level split/filter pass per call
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+_DIGITS = re.compile(r'\d')
+
+
+# Validation helpers hoisted to module scope: one function object for
+# all (parametrized) invocations, with repeat inputs memoized
+@lru_cache(maxsize=128)
+def is_valid_email(email):
+    return bool(email) and _EMAIL_RE.match(email) is not None
+
+
+@lru_cache(maxsize=128)
+def is_valid_phone(phone):
+    # Simple validation: at least 10 digits
+    return len(_DIGITS.findall(phone or '')) >= 10
+
+
 class TestBasicExamples:
     """Basic test examples that work without complex setup."""
     
@@ -98,159 +120,122 @@ class TestBasicExamples:
 class TestDataValidation:
     """Examples of data validation testing."""
     
-    def test_email_validation(self):
+    @pytest.mark.parametrize("email,valid", [
+        ('user@example.com', True),
+        ('test.email@domain.org', True),
+        ('admin@company.co.uk', True),
+        ('invalid-email', False),
+        ('@domain.com', False),
+        ('user@', False),
+        ('user.domain.com', False),
+        ('', False),
+        (None, False),
+    ])
+    def test_email_validation(self, email, valid):
         """Test email validation logic."""
-        # Arrange
-        def is_valid_email(email):
-            if not email or '@' not in email:
-                return False
-            parts = email.split('@')
-            if len(parts) != 2 or not parts[0] or not parts[1]:
-                return False
-            return '.' in parts[1]
-        
-        valid_emails = [
-            'user@example.com',
-            'test.email@domain.org',
-            'admin@company.co.uk'
-        ]
-        
-        invalid_emails = [
-            'invalid-email',
-            '@domain.com',
-            'user@',
-            'user.domain.com',
-            '',
-            None
-        ]
-        
-        # Act & Assert
-        for email in valid_emails:
-            assert is_valid_email(email), f"Email {email} should be valid"
-        
-        for email in invalid_emails:
-            assert not is_valid_email(email), f"Email {email} should be invalid"
-    
-    def test_phone_validation(self):
+        assert is_valid_email(email) == valid
+
+    @pytest.mark.parametrize("phone,valid", [
+        ('+1234567890', True),
+        ('1234567890', True),
+        ('+1 (234) 567-8900', True),
+        ('123-456-7890', True),
+        ('123', False),
+        ('123456789', False),
+        ('abc123def', False),
+        ('', False),
+    ])
+    def test_phone_validation(self, phone, valid):
         """Test phone number validation logic."""
-        # Arrange
-        def is_valid_phone(phone):
-            # Simple validation: at least 10 digits
-            digits = ''.join(filter(str.isdigit, phone))
-            return len(digits) >= 10
-        
-        valid_phones = [
-            '+1234567890',
-            '1234567890',
-            '+1 (234) 567-8900',
-            '123-456-7890'
-        ]
-        
-        invalid_phones = [
-            '123',
-            '123456789',
-            'abc123def',
-            ''
-        ]
-        
-        # Act & Assert
-        for phone in valid_phones:
-            assert is_valid_phone(phone), f"Phone {phone} should be valid"
-        
-        for phone in invalid_phones:
-            assert not is_valid_phone(phone), f"Phone {phone} should be invalid"
+        assert is_valid_phone(phone) == valid
+
+
+def get_highest_status(applications):
+    if not applications:
+        return None
+
+    highest_weight = -1
+    highest_status = None
+
+    for app in applications:
+        weight = _STATUS_WEIGHTS.get(app['status'], 0)
+        if weight > highest_weight:
+            highest_weight = weight
+            highest_status = app['status']
+
+    return highest_status
+
+
+def parse_intake_date(intake_str):
+    """Parse intake string like 'Jan 2026' or 'Sep 2026'."""
+    if not intake_str:
+        return None
+
+    parts = intake_str.split()
+    if len(parts) != 2:
+        return None
+
+    month, year = parts
+    try:
+        year_int = int(year)
+        return {'month': month, 'year': year_int}
+    except ValueError:
+        return None
+
+
+_STATUS_WEIGHTS = {
+    'Building Application': 1,
+    'Application Submitted to University': 2,
+    'Offer Received': 3,
+    'Offer Accepted by Student': 4,
+    'Visa Approved': 5,
+    'Dropped': 0
+}
+
+# Parametrize cases at module scope so each reports - and gets
+# scheduled under xdist - as its own test node
+_STATUS_CASES = [
+    (
+        [
+            {'status': 'Building Application', 'intake': 'Jan 2026'},
+            {'status': 'Offer Received', 'intake': 'Sep 2026'}
+        ],
+        'Offer Received'
+    ),
+    (
+        [
+            {'status': 'Application Submitted to University', 'intake': 'Jan 2026'},
+            {'status': 'Building Application', 'intake': 'Sep 2026'}
+        ],
+        'Application Submitted to University'
+    ),
+    ([], None),
+]
 
 
 class TestBusinessLogic:
     """Examples of business logic testing."""
-    
-    def test_status_priority_calculation(self):
+
+    @pytest.mark.parametrize(
+        "applications,expected",
+        _STATUS_CASES,
+        ids=[expected or 'empty' for _, expected in _STATUS_CASES],
+    )
+    def test_status_priority_calculation(self, applications, expected):
         """Test status priority calculation."""
-        # Arrange
-        status_weights = {
-            'Building Application': 1,
-            'Application Submitted to University': 2,
-            'Offer Received': 3,
-            'Offer Accepted by Student': 4,
-            'Visa Approved': 5,
-            'Dropped': 0
-        }
-        
-        def get_highest_status(applications):
-            if not applications:
-                return None
-            
-            highest_weight = -1
-            highest_status = None
-            
-            for app in applications:
-                weight = status_weights.get(app['status'], 0)
-                if weight > highest_weight:
-                    highest_weight = weight
-                    highest_status = app['status']
-            
-            return highest_status
-        
-        # Test cases
-        test_cases = [
-            {
-                'applications': [
-                    {'status': 'Building Application', 'intake': 'Jan 2026'},
-                    {'status': 'Offer Received', 'intake': 'Sep 2026'}
-                ],
-                'expected': 'Offer Received'
-            },
-            {
-                'applications': [
-                    {'status': 'Application Submitted to University', 'intake': 'Jan 2026'},
-                    {'status': 'Building Application', 'intake': 'Sep 2026'}
-                ],
-                'expected': 'Application Submitted to University'
-            },
-            {
-                'applications': [],
-                'expected': None
-            }
-        ]
-        
-        # Act & Assert
-        for case in test_cases:
-            result = get_highest_status(case['applications'])
-            assert result == case['expected'], f"Expected {case['expected']}, got {result}"
-    
-    def test_intake_date_parsing(self):
+        assert get_highest_status(applications) == expected
+
+    @pytest.mark.parametrize("intake_str,expected", [
+        ('Jan 2026', {'month': 'Jan', 'year': 2026}),
+        ('Sep 2026', {'month': 'Sep', 'year': 2026}),
+        ('Dec 2025', {'month': 'Dec', 'year': 2025}),
+        ('Invalid', None),
+        ('', None),
+        (None, None),
+    ])
+    def test_intake_date_parsing(self, intake_str, expected):
         """Test intake date parsing logic."""
-        # Arrange
-        def parse_intake_date(intake_str):
-            """Parse intake string like 'Jan 2026' or 'Sep 2026'."""
-            if not intake_str:
-                return None
-            
-            parts = intake_str.split()
-            if len(parts) != 2:
-                return None
-            
-            month, year = parts
-            try:
-                year_int = int(year)
-                return {'month': month, 'year': year_int}
-            except ValueError:
-                return None
-        
-        # Test cases
-        test_cases = [
-            ('Jan 2026', {'month': 'Jan', 'year': 2026}),
-            ('Sep 2026', {'month': 'Sep', 'year': 2026}),
-            ('Dec 2025', {'month': 'Dec', 'year': 2025}),
-            ('Invalid', None),
-            ('', None),
-            (None, None)
-        ]
-        
-        # Act & Assert
-        for intake_str, expected in test_cases:
-            result = parse_intake_date(intake_str)
-            assert result == expected, f"For '{intake_str}', expected {expected}, got {result}"
+        assert parse_intake_date(intake_str) == expected
 
 
 # Example of parametrized tests
@@ -293,41 +278,28 @@ def test_with_sample_data(sample_student_data):
     assert len(sample_student_data) == 3
 
 
+def validate_student_data(data):
+    errors = []
+
+    if not data.get('name') or len(data['name'].strip()) < 2:
+        errors.append("Name must be at least 2 characters")
+
+    if not data.get('email') or '@' not in data['email']:
+        errors.append("Valid email is required")
+
+    if not data.get('phone') or len(data['phone']) < 10:
+        errors.append("Phone must be at least 10 characters")
+
+    return errors
+
+
 # Example of testing with multiple assertions
-def test_comprehensive_data_validation():
+@pytest.mark.parametrize("data,expected_errors", [
+    ({'name': 'John Doe', 'email': 'john@example.com', 'phone': '+1234567890'}, 0),
+    ({'name': 'A', 'email': 'invalid', 'phone': '123'}, 3),
+    ({'name': 'Jane Smith', 'email': 'jane@example.com', 'phone': '123'}, 1),
+], ids=['all-valid', 'all-invalid', 'bad-phone'])
+def test_comprehensive_data_validation(data, expected_errors):
     """Test comprehensive data validation."""
-    # Arrange
-    def validate_student_data(data):
-        errors = []
-        
-        if not data.get('name') or len(data['name'].strip()) < 2:
-            errors.append("Name must be at least 2 characters")
-        
-        if not data.get('email') or '@' not in data['email']:
-            errors.append("Valid email is required")
-        
-        if not data.get('phone') or len(data['phone']) < 10:
-            errors.append("Phone must be at least 10 characters")
-        
-        return errors
-    
-    # Test cases
-    test_cases = [
-        {
-            'data': {'name': 'John Doe', 'email': 'john@example.com', 'phone': '+1234567890'},
-            'expected_errors': 0
-        },
-        {
-            'data': {'name': 'A', 'email': 'invalid', 'phone': '123'},
-            'expected_errors': 3
-        },
-        {
-            'data': {'name': 'Jane Smith', 'email': 'jane@example.com', 'phone': '123'},
-            'expected_errors': 1
-        }
-    ]
-    
-    # Act & Assert
-    for case in test_cases:
-        errors = validate_student_data(case['data'])
-        assert len(errors) == case['expected_errors'], f"Expected {case['expected_errors']} errors, got {len(errors)}"
+    errors = validate_student_data(data)
+    assert len(errors) == expected_errors, f"Expected {expected_errors} errors, got {len(errors)}"
@@ -2,12 +2,32 @@
 Test cases for Status Calculator service.
 """
 
+from dataclasses import dataclass
+from typing import Optional
+
 import pytest
 from app.services.status_calculator import StatusCalculator
 from app.models.student import Student
 from app.models.application import Application
 
 
+@dataclass(frozen=True, slots=True)
+class _AppStub:
+    """Plain stand-in for Application in pure-logic calculator tests.
+
+    calculate_highest_status only reads attributes, so a slotted
+    dataclass avoids SQLAlchemy's instrumented __init__ per object.
+    One ORM-backed test below still covers the real Application path.
+    """
+
+    university_name: str
+    program_name: str
+    intake: str
+    status: str
+    is_deleted: bool = False
+    intake_sortkey: Optional[int] = None
+
+
 class TestStatusCalculator:
     """Test cases for Status Calculator service."""
 
@@ -65,19 +85,19 @@ class TestStatusCalculator:
     def test_calculate_highest_status_multiple_applications(self):
         """Test calculating highest status with multiple applications."""
         applications = [
-            Application(
+            _AppStub(
                 university_name="University 1",
                 program_name="Program 1",
                 intake="Jan 2026",
                 status="Building Application",
             ),
-            Application(
+            _AppStub(
                 university_name="University 2",
                 program_name="Program 2",
                 intake="Feb 2026",
                 status="Offer Received",
             ),
-            Application(
+            _AppStub(
                 university_name="University 3",
                 program_name="Program 3",
                 intake="Mar 2026",
@@ -92,13 +112,13 @@ class TestStatusCalculator:
     def test_calculate_highest_status_tie_breaker(self):
         """Test tie-breaker logic when multiple applications have same status."""
         applications = [
-            Application(
+            _AppStub(
                 university_name="University 1",
                 program_name="Program 1",
                 intake="Sep 2026",
                 status="Offer Received",
             ),
-            Application(
+            _AppStub(
                 university_name="University 2",
                 program_name="Program 2",
                 intake="Jan 2026",
@@ -110,16 +130,27 @@ class TestStatusCalculator:
         assert result["highest_status"] == "Offer Received"
         assert result["highest_intake"] == "Jan 2026"  # Earlier intake wins
 
+        # The packed integer key encodes the same contract: equal
+        # weights, earlier intake ranks strictly higher
+        jan_key = StatusCalculator.pack_rank_key("Offer Received", "Jan 2026")
+        sep_key = StatusCalculator.pack_rank_key("Offer Received", "Sep 2026")
+        assert jan_key > sep_key
+
+        # A higher status beats any intake advantage
+        assert StatusCalculator.pack_rank_key(
+            "Offer Accepted by Student", "Dec 2100"
+        ) > jan_key
+
     def test_calculate_highest_status_with_dropped(self):
         """Test calculating highest status with dropped applications."""
         applications = [
-            Application(
+            _AppStub(
                 university_name="University 1",
                 program_name="Program 1",
                 intake="Jan 2026",
                 status="Dropped",
             ),
-            Application(
+            _AppStub(
                 university_name="University 2",
                 program_name="Program 2",
                 intake="Feb 2026",
@@ -134,13 +165,13 @@ class TestStatusCalculator:
     def test_calculate_highest_status_all_dropped(self):
         """Test calculating highest status when all applications are dropped."""
         applications = [
-            Application(
+            _AppStub(
                 university_name="University 1",
                 program_name="Program 1",
                 intake="Jan 2026",
                 status="Dropped",
             ),
-            Application(
+            _AppStub(
                 university_name="University 2",
                 program_name="Program 2",
                 intake="Feb 2026",